@@ -71,7 +71,6 @@ class BenchmarkWorker:
         self.provider_clients: Dict[str, Any] = {}
         self.entity_context = self.load_competitor_context()
         self.spec_cache: Dict[Tuple[str, ...], Sequence[Any]] = {}
-        self.pattern_cache: Dict[Tuple[str, ...], Dict[str, Any]] = {}
 
     @staticmethod
     def require_env(name: str) -> str:
@@ -173,20 +172,16 @@ class BenchmarkWorker:
         self, our_terms: Sequence[str]
     ) -> Tuple[Sequence[Any], Dict[str, Any]]:
         key = tuple(term.lower() for term in our_terms)
-        cached_specs = self.spec_cache.get(key)
-        cached_patterns = self.pattern_cache.get(key)
-        if cached_specs is not None and cached_patterns is not None:
-            return cached_specs, cached_patterns
-
-        specs = build_entity_specs(
-            our_terms=list(our_terms),
-            competitors=self.entity_context.competitors,
-            competitor_aliases=self.entity_context.aliases_by_name,
-        )
-        compiled = compile_entity_patterns(specs)
-        self.spec_cache[key] = specs
-        self.pattern_cache[key] = compiled
-        return specs, compiled
+        specs = self.spec_cache.get(key)
+        if specs is None:
+            specs = build_entity_specs(
+                our_terms=list(our_terms),
+                competitors=self.entity_context.competitors,
+                competitor_aliases=self.entity_context.aliases_by_name,
+            )
+            self.spec_cache[key] = specs
+        # compile_entity_patterns memoizes the regexes by alias signature.
+        return specs, compile_entity_patterns(specs)
 
     def _get_provider_client(self, provider: str) -> Any:
         cached = self.provider_clients.get(provider)
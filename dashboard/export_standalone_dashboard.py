@@ -4,10 +4,22 @@
 from __future__ import annotations
 
 import argparse
+import collections
+import contextlib
 import csv
+import functools
+import itertools
 import json
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 
 ROOT = Path(__file__).resolve().parent
@@ -15,6 +27,27 @@ PROJECT_ROOT = ROOT.parent
 DEFAULT_TEMPLATE = ROOT / "dashboard.html"
 DEFAULT_OUTPUT_DIR = PROJECT_ROOT / "output"
 DEFAULT_EXPORT = PROJECT_ROOT / "output" / "dashboard_standalone.html"
+JSONL_READ_CHUNK_BYTES = 1 << 20
+JSONL_PARALLEL_MIN_BYTES = 64 << 20
+# Each worker parses one range at a time, and at most one finished range per
+# worker waits to be yielded, so memory stays bounded by these two settings.
+JSONL_PARALLEL_RANGE_BYTES = 16 << 20
+JSONL_MAX_WORKERS = 4
+DASHBOARD_SCRIPT_MARKER = "  <script>\n    const ENTITY_LABELS = {"
+EMBED_PREFIX = "  <script>\n    window.__EMBEDDED_BENCHMARK_DATA__ = "
+EMBED_SUFFIX = ";\n  </script>\n\n"
+WEB_SEARCH_FLAG_VALUES: Dict[Any, str] = {
+    True: "yes",
+    False: "no",
+    None: "",
+    "": "",
+    "1": "yes",
+    "true": "yes",
+    "yes": "yes",
+    "0": "no",
+    "false": "no",
+    "no": "no",
+}
 
 
 def parse_args() -> argparse.Namespace:
@@ -39,90 +72,328 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def read_csv_rows(path: Path) -> List[Dict[str, str]]:
+def _loads(raw: str | bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN or oversized ints; let the stdlib decide.
+    return json.loads(raw)
+
+
+def _dumps(value: Any) -> bytes:
+    # The template declares UTF-8, so non-ASCII text is embedded as-is; only
+    # "</" needs escaping, which happens when the payload is spliced in.
+    if orjson is not None:
+        try:
+            return orjson.dumps(value)
+        except orjson.JSONEncodeError:
+            pass  # Ints wider than 64 bits; the stdlib encodes them.
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode(
+        "utf-8"
+    )
+
+
+def iter_csv_rows(path: Path) -> Iterator[Dict[str, str | None]]:
+    # Zip each positional row against the header tuple instead of paying
+    # DictReader's per-row bookkeeping. Short rows are padded with None the
+    # way DictReader does, so ragged files still produce every key.
     with path.open("r", encoding="utf-8", newline="") as handle:
-        return list(csv.DictReader(handle))
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if header is None:
+            return
+        fieldnames = tuple(header)
+        padding: List[str | None] = [None] * len(fieldnames)
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < len(fieldnames):
+                yield dict(zip(fieldnames, row + padding[len(row) :]))
+            else:
+                yield dict(zip(fieldnames, row))
+
+
+def read_csv_rows(path: Path) -> List[Dict[str, str | None]]:
+    return list(iter_csv_rows(path))
 
 
 def normalize_web_search_flag(value: Any) -> str:
-    if isinstance(value, bool):
-        return "yes" if value else "no"
-    raw = str(value or "").strip().lower()
-    if raw in {"1", "true", "yes"}:
-        return "yes"
-    if raw in {"0", "false", "no"}:
-        return "no"
-    return raw
+    # Canonical JSONL values (bools, None, already-clean strings) resolve in
+    # one lookup; only unusual spellings fall through to strip/lower.
+    try:
+        flag = WEB_SEARCH_FLAG_VALUES.get(value)
+    except TypeError:
+        flag = None
+    if flag is not None:
+        return flag
+    return _normalize_web_search_text(str(value or ""))
+
+
+@functools.lru_cache(maxsize=64)
+def _normalize_web_search_text(raw: str) -> str:
+    # JSONL files repeat a handful of spellings, so memoize strip/lower.
+    text = raw.strip().lower()
+    return WEB_SEARCH_FLAG_VALUES.get(text, text)
+
+
+def _iter_jsonl_lines(path: Path) -> Iterator[bytes]:
+    # Both JSON backends accept UTF-8 bytes, so skip the text-mode decode and
+    # split large binary reads ourselves, carrying partial lines across chunks.
+    tail = b""
+    with path.open("rb") as handle:
+        while True:
+            chunk = handle.read(JSONL_READ_CHUNK_BYTES)
+            if not chunk:
+                break
+            lines = (tail + chunk).split(b"\n")
+            tail = lines.pop()
+            yield from lines
+    if tail:
+        yield tail
+
+
+def _summarize_jsonl_lines(
+    lines: Iterable[bytes],
+    *,
+    loads: Callable[[bytes], Any] = _loads,
+    decode_error: type[ValueError] = ValueError,
+    get: Callable[..., Any] = dict.get,
+    strip: Callable[[bytes], bytes] = bytes.strip,
+    normalize_flag: Callable[[Any], str] = normalize_web_search_flag,
+) -> Iterator[Dict[str, Any]]:
+    # The per-row callables are bound once as keyword defaults, so every
+    # lookup in this loop (one iteration per response) is a fast local.
+    for line in lines:
+        line = strip(line)
+        if not line:
+            continue
+        try:
+            raw = loads(line)
+        except decode_error:  # Malformed JSON or invalid UTF-8.
+            continue
+        # The benchmark writes one object per line; skip anything else.
+        if raw.__class__ is not dict:
+            continue
+        citations = get(raw, "citations")
+        yield {
+            "timestamp": get(raw, "timestamp"),
+            "model": get(raw, "model"),
+            "query": get(raw, "query"),
+            "run_id": get(raw, "run_id"),
+            "web_search_enabled": normalize_flag(get(raw, "web_search_enabled")),
+            "citation_count": len(citations) if citations.__class__ is list else 0,
+            "error": get(raw, "error"),
+        }
+
+
+def _jsonl_worker_count(path: Path) -> int:
+    if path.stat().st_size < JSONL_PARALLEL_MIN_BYTES:
+        return 1
+    return min(os.cpu_count() or 1, JSONL_MAX_WORKERS)
+
+
+def _jsonl_byte_ranges(path: Path, parts: int) -> List[Tuple[int, int]]:
+    # Split the file into roughly equal byte ranges that end on a newline.
+    size = path.stat().st_size
+    boundaries = [0]
+    with path.open("rb") as handle:
+        for index in range(1, parts):
+            handle.seek(max(size * index // parts, boundaries[-1]))
+            handle.readline()
+            boundaries.append(min(handle.tell(), size))
+    boundaries.append(size)
+    return [
+        (start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start
+    ]
+
+
+def _parse_jsonl_range(path: str, start: int, end: int) -> List[Dict[str, Any]]:
+    with open(path, "rb") as handle:
+        handle.seek(start)
+        data = handle.read(end - start)
+    return list(_summarize_jsonl_lines(data.split(b"\n")))
+
+
+def iter_jsonl_rows(path: Path) -> Iterator[Dict[str, Any]]:
+    workers = _jsonl_worker_count(path)
+    if workers < 2:
+        yield from _summarize_jsonl_lines(_iter_jsonl_lines(path))
+        return
+
+    # Large files: parse newline-aligned byte ranges in worker processes,
+    # keeping one range in flight per worker and yielding each range's rows
+    # in file order as soon as it is done.
+    parts = max(workers, -(-path.stat().st_size // JSONL_PARALLEL_RANGE_BYTES))
+    ranges = iter(_jsonl_byte_ranges(path, parts))
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        pending = collections.deque(
+            executor.submit(_parse_jsonl_range, str(path), start, end)
+            for start, end in itertools.islice(ranges, workers)
+        )
+        while pending:
+            rows = pending.popleft().result()
+            for start, end in itertools.islice(ranges, 1):
+                pending.append(
+                    executor.submit(_parse_jsonl_range, str(path), start, end)
+                )
+            yield from rows
+    finally:
+        # An early close or a failed range drops the queued ranges instead of
+        # parsing the rest of the file.
+        executor.shutdown(cancel_futures=True)
 
 
 def read_jsonl_rows(path: Path) -> List[Dict[str, Any]]:
-    rows: List[Dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as handle:
-        for line in handle:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                raw = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            citations = raw.get("citations")
-            citation_count = len(citations) if isinstance(citations, list) else 0
-            rows.append(
-                {
-                    "timestamp": raw.get("timestamp"),
-                    "model": raw.get("model"),
-                    "query": raw.get("query"),
-                    "run_id": raw.get("run_id"),
-                    "web_search_enabled": normalize_web_search_flag(
-                        raw.get("web_search_enabled")
-                    ),
-                    "citation_count": citation_count,
-                    "error": raw.get("error"),
-                }
-            )
-    return rows
+    return list(iter_jsonl_rows(path))
 
 
-def build_payload(output_dir: Path) -> Dict[str, Any]:
+def resolve_output_paths(output_dir: Path) -> Tuple[Path, Path, Path]:
     comparison_path = output_dir / "comparison_table.csv"
     viability_path = output_dir / "viability_index.csv"
     jsonl_path = output_dir / "llm_outputs.jsonl"
 
-    missing = [
-        str(path)
-        for path in (comparison_path, viability_path, jsonl_path)
-        if not path.exists()
-    ]
+    # One stat per file; only "does not exist" counts as missing, any other
+    # OSError (e.g. permissions) surfaces as-is.
+    missing: List[str] = []
+    for path in (comparison_path, viability_path, jsonl_path):
+        try:
+            os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            missing.append(str(path))
     if missing:
         missing_text = "\n".join(missing)
         raise FileNotFoundError(f"Missing required output files:\n{missing_text}")
+    return comparison_path, viability_path, jsonl_path
 
-    comparison_rows = read_csv_rows(comparison_path)
-    viability_rows = read_csv_rows(viability_path)
-    jsonl_rows = read_jsonl_rows(jsonl_path)
 
+def build_payload(output_dir: Path) -> Dict[str, Any]:
+    comparison_path, viability_path, jsonl_path = resolve_output_paths(output_dir)
     return {
-        "comparisonRows": comparison_rows,
-        "viabilityRows": viability_rows,
-        "jsonlRows": jsonl_rows,
+        "comparisonRows": read_csv_rows(comparison_path),
+        "viabilityRows": read_csv_rows(viability_path),
+        "jsonlRows": read_jsonl_rows(jsonl_path),
     }
 
 
-def embed_data(template_text: str, payload: Dict[str, Any]) -> str:
-    marker = "  <script>\n    const ENTITY_LABELS = {"
-    if marker not in template_text:
+def build_payload_json(output_dir: Path) -> bytearray:
+    # Serialize row by row so the parsed rows are never held as full lists.
+    comparison_path, viability_path, jsonl_path = resolve_output_paths(output_dir)
+    sections: Tuple[Tuple[str, Iterable[Dict[str, Any]]], ...] = (
+        ("comparisonRows", iter_csv_rows(comparison_path)),
+        ("viabilityRows", iter_csv_rows(viability_path)),
+        ("jsonlRows", iter_jsonl_rows(jsonl_path)),
+    )
+    # The buffer itself is returned, so the payload is never copied out of it.
+    buffer = bytearray()
+    write = buffer.extend
+    dumps = _dumps
+    opener = b"{"
+    for key, rows in sections:
+        write(opener + dumps(key) + b":[")
+        opener = b","
+        # Only one row's dict and its encoded bytes are alive at a time; the
+        # separator is swapped in after the first row instead of testing an
+        # index on every iteration.
+        separator = b""
+        for row in rows:
+            write(separator)
+            write(dumps(row))
+            separator = b","
+        write(b"]")
+    write(b"}")
+    return buffer
+
+
+def _escape_script_close(
+    payload_json: bytes | bytearray,
+) -> Iterator[bytes | memoryview]:
+    # Yield the payload as views between each "</" and its escaped form, so a
+    # "</script>" inside a string cannot close the tag and the payload is
+    # never copied by a whole-buffer replace.
+    view = memoryview(payload_json)
+    start = 0
+    index = payload_json.find(b"</")
+    while index >= 0:
+        yield view[start:index]
+        yield b"<\\/"
+        start = index + 2
+        index = payload_json.find(b"</", start)
+    yield view[start:]
+
+
+def _find_marker(template: bytes | mmap.mmap) -> int:
+    index = template.find(DASHBOARD_SCRIPT_MARKER.encode("utf-8"))
+    if index < 0:
         raise ValueError("Could not find dashboard script marker in template HTML.")
+    return index
 
-    payload_text = json.dumps(payload, ensure_ascii=True).replace("</", "<\\/")
-    inject = (
-        "  <script>\n"
-        f"    window.__EMBEDDED_BENCHMARK_DATA__ = {payload_text};\n"
-        "  </script>\n\n"
-        "  <script>\n"
-        "    const ENTITY_LABELS = {"
+
+@contextlib.contextmanager
+def _map_template(path: Path) -> Iterator[mmap.mmap]:
+    with path.open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            raise ValueError("Could not find dashboard script marker in template HTML.")
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as template_map:
+            yield template_map
+
+
+def _standalone_html_parts(
+    template_head: bytes | memoryview,
+    payload_json: bytes | bytearray,
+    template_tail: bytes | memoryview,
+) -> Iterator[bytes | memoryview]:
+    yield template_head
+    yield EMBED_PREFIX.encode("utf-8")
+    yield from _escape_script_close(payload_json)
+    yield EMBED_SUFFIX.encode("utf-8")
+    yield template_tail
+
+
+def embed_data(template_text: str, payload: Dict[str, Any]) -> str:
+    template = template_text.encode("utf-8")
+    marker_index = _find_marker(template)
+    parts = _standalone_html_parts(
+        template[:marker_index], _dumps(payload), template[marker_index:]
     )
-    return template_text.replace(marker, inject, 1)
+    return b"".join(parts).decode("utf-8")
+
+
+def write_export(path: Path, chunks: Iterable[bytes | memoryview]) -> None:
+    # Write the already-encoded document straight to the fd, without another
+    # layer of buffering. New files get 0o666 minus the umask, as open() would.
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o666)
+    try:
+        for chunk in chunks:
+            with memoryview(chunk) as view:
+                while view:
+                    view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def write_standalone_html(
+    export_path: Path,
+    template_path: Path,
+    payload_json: bytes | bytearray,
+) -> None:
+    # The template is memory-mapped and its two halves are written straight
+    # from the mapping, so the static HTML is never copied or decoded.
+    with (
+        _map_template(template_path) as template_map,
+        memoryview(template_map) as template_view,
+    ):
+        marker_index = _find_marker(template_map)
+        with (
+            template_view[:marker_index] as template_head,
+            template_view[marker_index:] as template_tail,
+        ):
+            write_export(
+                export_path,
+                _standalone_html_parts(template_head, payload_json, template_tail),
+            )
 
 
 def main() -> int:
@@ -134,11 +405,8 @@ def main() -> int:
     if not template_path.exists():
         raise FileNotFoundError(f"Template file not found: {template_path}")
 
-    payload = build_payload(output_dir)
-    template_text = template_path.read_text(encoding="utf-8")
-    standalone_html = embed_data(template_text, payload)
-
-    export_path.write_text(standalone_html, encoding="utf-8")
+    payload_json = build_payload_json(output_dir)
+    write_standalone_html(export_path, template_path, payload_json)
     print(f"Wrote standalone dashboard: {export_path}")
     return 0
 
@@ -1 +0,0 @@
-dashboard/export_standalone_dashboard.py
\ No newline at end of file
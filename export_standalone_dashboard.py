@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""Compatibility wrapper for dashboard/export_standalone_dashboard.py."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from dashboard import export_standalone_dashboard as _exporter  # noqa: E402
+
+_EXPORTED_NAMES = [name for name in dir(_exporter) if not name.startswith("_")]
+
+for _name in _EXPORTED_NAMES:
+    globals()[_name] = getattr(_exporter, _name)
+
+main = _exporter.main
+__all__ = list(_EXPORTED_NAMES)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
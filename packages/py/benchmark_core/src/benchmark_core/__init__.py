@@ -19,6 +19,7 @@ from .entities import (
 from .providers import (
     GeminiRestClient,
     ProviderRequestError,
+    ResponseCache,
     create_anthropic_client,
     create_gemini_client,
     create_llm_client,
@@ -42,6 +43,7 @@ __all__ = [
     "EntitySpec",
     "GeminiRestClient",
     "ProviderRequestError",
+    "ResponseCache",
     "alias_to_pattern",
     "build_entity_specs",
     "compile_entity_patterns",
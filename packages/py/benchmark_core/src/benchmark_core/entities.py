@@ -1,6 +1,7 @@
 """Entity and mention-detection helpers."""
 
 from .legacy import (
+    CompiledEntityPatterns,
     EntitySpec,
     alias_to_pattern,
     build_entity_specs,
@@ -9,6 +10,7 @@ from .legacy import (
 )
 
 __all__ = [
+    "CompiledEntityPatterns",
     "EntitySpec",
     "alias_to_pattern",
     "build_entity_specs",
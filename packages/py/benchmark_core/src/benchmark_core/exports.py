@@ -11,13 +11,20 @@ from __future__ import annotations
 
 import argparse
 import csv
+import functools
 import json
+import os
 import re
 import uuid
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Sequence, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+try:
+    import orjson
+except ImportError:  # Optional: JSONL lines fall back to the stdlib parser.
+    orjson = None
 
 from .paths import ARTIFACTS_DIR
 
@@ -130,8 +137,12 @@ COMPETITOR_METRIC_FIELDNAMES = [
     "run_id",
 ]
 
+H2H_WINNERS = ("competitor", "tie", "highcharts")
+
 _SPECIAL_COUNT_COLUMNS = {"citation_count", "viability_index_count"}
 _UPPERCASE_TOKENS = {"ag", "ai", "api", "llm", "ml", "sql", "ui", "ux"}
+_SLUG_SEPARATOR_PATTERN = re.compile(r"[^a-z0-9]+")
+_NUMBERED_KEY_PATTERN = re.compile(r"^(.*)_(\d+)$")
 
 
 @dataclass(frozen=True)
@@ -271,19 +282,33 @@ def read_csv_rows(path: Path) -> List[Dict[str, str]]:
         return list(csv.DictReader(handle))
 
 
-def read_jsonl_rows(path: Path) -> List[Dict[str, Any]]:
-    rows: List[Dict[str, Any]] = []
-    if not path.exists():
-        return rows
-    for line in path.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line:
-            continue
+def _decode_jsonl_line(line: bytes) -> Any:
+    if orjson is not None:
         try:
-            rows.append(json.loads(line))
-        except json.JSONDecodeError:
-            continue
-    return rows
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN or oversized ints; let the stdlib decide.
+    return json.loads(line)
+
+
+def iter_jsonl_rows(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield parsed JSONL records one line at a time, skipping invalid lines."""
+    if not path.exists():
+        return
+    # Binary lines go straight to the parser, which decodes UTF-8 itself.
+    with path.open("rb") as handle:
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield _decode_jsonl_line(line)
+            except ValueError:  # Malformed JSON or invalid UTF-8.
+                continue
+
+
+def read_jsonl_rows(path: Path) -> List[Dict[str, Any]]:
+    return list(iter_jsonl_rows(path))
 
 
 def infer_model_owner_from_model(model: str) -> str:
@@ -305,14 +330,18 @@ def infer_model_owner_from_model(model: str) -> str:
     return "Unknown"
 
 
+def model_owner_for_row(row: Dict[str, Any], model: str) -> str:
+    explicit_owner = str(row.get("model_owner") or "").strip()
+    return explicit_owner or infer_model_owner_from_model(model)
+
+
 def build_model_owner_mapping(rows: Iterable[Dict[str, Any]]) -> Dict[str, str]:
     mapping: Dict[str, str] = {}
     for row in rows:
         model = str(row.get("model") or "").strip()
         if not model:
             continue
-        explicit_owner = str(row.get("model_owner") or "").strip()
-        owner = explicit_owner or infer_model_owner_from_model(model)
+        owner = model_owner_for_row(row, model)
         if not owner:
             continue
         mapping[model] = owner
@@ -320,35 +349,29 @@ def build_model_owner_mapping(rows: Iterable[Dict[str, Any]]) -> Dict[str, str]:
 
 
 def extract_context(jsonl_rows: Iterable[Dict[str, Any]]) -> Dict[str, str]:
-    normalized_rows = list(jsonl_rows)
-    timestamps = sorted(
-        str(row.get("timestamp")) for row in normalized_rows if row.get("timestamp")
-    )
-    models = sorted(
-        {
-            str(row.get("model")).strip()
-            for row in normalized_rows
-            if str(row.get("model") or "").strip()
-        }
-    )
-    owner_mapping = build_model_owner_mapping(normalized_rows)
-    model_owners = sorted({owner for owner in owner_mapping.values() if owner})
-    owner_map_str = ";".join(
-        f"{model}=>{owner}" for model, owner in sorted(owner_mapping.items())
-    )
-
-    model_stats: List[Dict[str, Any]] = []
-    rows_by_model: Dict[str, List[Dict[str, Any]]] = {}
+    # Rows may be a lazy stream, so everything is gathered in a single pass.
+    window_start = ""
+    window_end = ""
+    owner_mapping: Dict[str, str] = {}
+    totals_by_model: Dict[str, Dict[str, int]] = {}
     total_prompt_tokens = 0
     total_completion_tokens = 0
     total_tokens = 0
     total_duration_ms = 0
 
-    for row in normalized_rows:
+    for row in jsonl_rows:
+        if row.get("timestamp"):
+            timestamp = str(row.get("timestamp"))
+            if not window_start or timestamp < window_start:
+                window_start = timestamp
+            if timestamp > window_end:
+                window_end = timestamp
         model = str(row.get("model") or "").strip()
         if not model:
             continue
-        rows_by_model.setdefault(model, []).append(row)
+        owner = model_owner_for_row(row, model)
+        if owner:
+            owner_mapping[model] = owner
         prompt_tokens = to_int(row.get("prompt_tokens"))
         completion_tokens = to_int(row.get("completion_tokens"))
         call_total_tokens = to_int(row.get("total_tokens")) or (
@@ -360,46 +383,51 @@ def extract_context(jsonl_rows: Iterable[Dict[str, Any]]) -> Dict[str, str]:
         total_tokens += call_total_tokens
         total_duration_ms += duration_ms
 
-    for model in sorted(rows_by_model.keys()):
-        model_rows = rows_by_model[model]
-        response_count = len(model_rows)
-        error_count = sum(1 for row in model_rows if str(row.get("error") or "").strip())
-        model_prompt_tokens = sum(to_int(row.get("prompt_tokens")) for row in model_rows)
-        model_completion_tokens = sum(
-            to_int(row.get("completion_tokens")) for row in model_rows
-        )
-        model_total_tokens = sum(
-            to_int(row.get("total_tokens"))
-            or (to_int(row.get("prompt_tokens")) + to_int(row.get("completion_tokens")))
-            for row in model_rows
-        )
-        model_total_duration_ms = sum(to_int(row.get("duration_ms")) for row in model_rows)
+        model_totals = totals_by_model.get(model)
+        if model_totals is None:
+            model_totals = totals_by_model[model] = {
+                "response_count": 0,
+                "error_count": 0,
+                "total_prompt_tokens": 0,
+                "total_completion_tokens": 0,
+                "total_tokens": 0,
+                "total_duration_ms": 0,
+            }
+        model_totals["response_count"] += 1
+        if str(row.get("error") or "").strip():
+            model_totals["error_count"] += 1
+        model_totals["total_prompt_tokens"] += prompt_tokens
+        model_totals["total_completion_tokens"] += completion_tokens
+        model_totals["total_tokens"] += call_total_tokens
+        model_totals["total_duration_ms"] += duration_ms
+
+    models = sorted(totals_by_model)
+    model_owners = sorted({owner for owner in owner_mapping.values() if owner})
+    owner_map_str = ";".join(
+        f"{model}=>{owner}" for model, owner in sorted(owner_mapping.items())
+    )
+
+    model_stats: List[Dict[str, Any]] = []
+    for model in models:
+        model_totals = totals_by_model[model]
+        response_count = model_totals["response_count"]
         model_stats.append(
             {
                 "model": model,
                 "owner": owner_mapping.get(model, infer_model_owner_from_model(model)),
-                "response_count": response_count,
-                "error_count": error_count,
-                "total_prompt_tokens": model_prompt_tokens,
-                "total_completion_tokens": model_completion_tokens,
-                "total_tokens": model_total_tokens,
-                "total_duration_ms": model_total_duration_ms,
+                **model_totals,
                 "avg_duration_ms": round(
-                    model_total_duration_ms / response_count, 2
-                )
-                if response_count
-                else 0.0,
+                    model_totals["total_duration_ms"] / response_count, 2
+                ),
                 "avg_total_tokens": round(
-                    model_total_tokens / response_count, 2
-                )
-                if response_count
-                else 0.0,
+                    model_totals["total_tokens"] / response_count, 2
+                ),
             }
         )
 
     return {
-        "window_start_utc": timestamps[0] if timestamps else "",
-        "window_end_utc": timestamps[-1] if timestamps else "",
+        "window_start_utc": window_start,
+        "window_end_utc": window_end,
         "models": ";".join(models),
         "model_owners": ";".join(model_owners),
         "model_owner_map": owner_map_str,
@@ -422,7 +450,7 @@ def format_dd_mm_yyyy(iso_datetime: str) -> str:
 
 
 def slugify(value: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "_", value.lower()).strip("_")
+    return _SLUG_SEPARATOR_PATTERN.sub("_", value.lower()).strip("_")
 
 
 def infer_entity_keys(comparison_rows: Sequence[Dict[str, str]]) -> List[str]:
@@ -446,11 +474,12 @@ def infer_entity_keys(comparison_rows: Sequence[Dict[str, str]]) -> List[str]:
     return keys
 
 
+@functools.lru_cache(maxsize=512)
 def humanize_entity_key(entity_key: str) -> str:
     if entity_key in ENTITY_LABEL_OVERRIDES:
         return ENTITY_LABEL_OVERRIDES[entity_key]
 
-    suffix_match = re.match(r"^(.*)_(\d+)$", entity_key)
+    suffix_match = _NUMBERED_KEY_PATTERN.match(entity_key)
     if suffix_match:
         base_key = suffix_match.group(1)
         suffix = suffix_match.group(2)
@@ -486,7 +515,7 @@ def infer_entity_labels(
     for key in entity_keys:
         if key in labels:
             continue
-        base_match = re.match(r"^(.*)_(\d+)$", key)
+        base_match = _NUMBERED_KEY_PATTERN.match(key)
         if base_match and base_match.group(1) in labels:
             labels[key] = f"{labels[base_match.group(1)]} ({base_match.group(2)})"
             continue
@@ -586,12 +615,10 @@ def h2h_values(
         competitor_share = 0.0
 
     gap = round(highcharts_rate - entity_rate, 4)
-    if highcharts_count > entity_count:
-        winner = "highcharts"
-    elif entity_count > highcharts_count:
-        winner = "competitor"
-    else:
-        winner = "tie"
+    # Sign of the count difference (-1, 0, 1) shifted to index H2H_WINNERS.
+    winner = H2H_WINNERS[
+        (highcharts_count > entity_count) - (highcharts_count < entity_count) + 1
+    ]
 
     return {
         "h2h_highcharts_share_score": highcharts_share,
@@ -616,6 +643,10 @@ def build_rows(
         raise RuntimeError("comparison_table.csv must include an OVERALL row.")
 
     competitor_keys = [item.key for item in entity_meta if item.key != HIGHCHARTS_KEY]
+    date_dd_mm_yyyy = format_dd_mm_yyyy(context["window_end_utc"])
+    snapshot_fields = {
+        item.key: entity_snapshot_fieldnames(item.key) for item in entity_meta
+    }
 
     overall_entity: Dict[str, Dict[str, Any]] = {}
     for item in entity_meta:
@@ -648,26 +679,35 @@ def build_rows(
     )
 
     all_rows: List[Dict[str, Any]] = []
-    for query_row in query_rows:
-        query = query_row["query"]
-        runs = to_int(query_row.get("runs"))
-        web_search_enabled = normalize_yes_no(query_row.get("web_search_enabled"))
-        highcharts_count = to_int(query_row.get(f"{HIGHCHARTS_KEY}_count"))
-        highcharts_rate = to_float(query_row.get(f"{HIGHCHARTS_KEY}_rate"))
+
+    def append_entity_rows(
+        source_row: Dict[str, str],
+        query: str,
+        is_overall: bool,
+        ai_score: float,
+        highcharts_rate: float,
+    ) -> None:
+        runs = to_int(source_row.get("runs"))
+        web_search_enabled = normalize_yes_no(source_row.get("web_search_enabled"))
+        highcharts_count = to_int(source_row.get(f"{HIGHCHARTS_KEY}_count"))
         excl_count, excl_rate = compute_excl_viability(
-            query_row=query_row,
+            query_row=source_row,
             competitor_keys=competitor_keys,
         )
+        overall_flag = "yes" if is_overall else "no"
+        # Every entity row of this query carries the same snapshot columns, so
+        # parse the query's per-entity cells once and reuse them for each row.
+        snapshot = entity_snapshot_fields(source_row, entity_meta)
 
         for item in entity_meta:
             entity_info = overall_entity[item.key]
-            entity_count = to_int(query_row.get(f"{item.key}_count"))
-            entity_rate = compute_mention_rate(entity_count, query_row.get("runs"))
-            mentioned_yes_value = query_row.get(f"{item.key}_yes")
-            if mentioned_yes_value in (None, ""):
+            count_field, rate_field, yes_field = snapshot_fields[item.key]
+            entity_count = snapshot[count_field]
+            entity_rate = snapshot[rate_field]
+            if is_overall:
                 mentioned_yes = "yes" if entity_count > 0 else "no"
             else:
-                mentioned_yes = normalize_yes_no(mentioned_yes_value)
+                mentioned_yes = snapshot[yes_field]
 
             h2h = h2h_values(
                 highcharts_count=highcharts_count,
@@ -685,24 +725,24 @@ def build_rows(
                 "is_competitor_excl_highcharts": (
                     "no" if item.key == HIGHCHARTS_KEY else "yes"
                 ),
-                "is_overall_row": "no",
+                "is_overall_row": overall_flag,
                 "query_runs": runs,
                 "mentions_count": entity_count,
                 "mentions_rate": round(entity_rate, 6),
-                "ai_visibility_query_score": f"{query_scores.get(query, 0.0):.2f}",
+                "ai_visibility_query_score": f"{ai_score:.2f}",
                 "mentioned_yes": mentioned_yes,
-                "query_citation_count": to_int(query_row.get("citation_count")),
+                "query_citation_count": to_int(source_row.get("citation_count")),
                 "query_viability_raw_count": to_int(
-                    query_row.get("viability_index_count")
+                    source_row.get("viability_index_count")
                 ),
                 "query_viability_raw_rate": round(
-                    to_float(query_row.get("viability_index_rate")), 6
+                    to_float(source_row.get("viability_index_rate")), 6
                 ),
                 "query_viability_excl_highcharts_count": excl_count,
                 "query_viability_excl_highcharts_rate": excl_rate,
                 "window_start_utc": context["window_start_utc"],
                 "window_end_utc": context["window_end_utc"],
-                "date_dd_mm_yyyy": format_dd_mm_yyyy(context["window_end_utc"]),
+                "date_dd_mm_yyyy": date_dd_mm_yyyy,
                 "models": context["models"],
                 "model_owners": context.get("model_owners", ""),
                 "model_owner_map": context.get("model_owner_map", ""),
@@ -715,7 +755,7 @@ def build_rows(
                     "h2h_gap_rate_highcharts_minus_entity"
                 ],
                 "h2h_winner": h2h["h2h_winner"],
-                "is_overall_entity_row": "no",
+                "is_overall_entity_row": overall_flag,
                 "entity_chart_sort": entity_info["entity_chart_sort"],
                 "entity_color_hex": entity_info["entity_color_hex"],
                 "overall_entity_mentions_count": entity_info[
@@ -733,94 +773,31 @@ def build_rows(
                 "run_month": run_month,
                 "run_id": run_id,
             }
-            add_entity_snapshot_fields(
-                row=row,
-                source_row=query_row,
-                entity_meta=entity_meta,
-            )
+            row.update(snapshot)
             all_rows.append(row)
 
-    # Add one OVERALL row per entity for simple chart filtering in Looker.
-    overall_runs = to_int(overall_row.get("runs"))
-    overall_highcharts_count = to_int(overall_row.get(f"{HIGHCHARTS_KEY}_count"))
-    overall_highcharts_rate = compute_mention_rate(
-        overall_highcharts_count,
-        overall_row.get("runs"),
-    )
-    excl_count, excl_rate = compute_excl_viability(
-        query_row=overall_row,
-        competitor_keys=competitor_keys,
-    )
-    overall_web = normalize_yes_no(overall_row.get("web_search_enabled"))
-
-    for item in entity_meta:
-        entity_info = overall_entity[item.key]
-        entity_count = entity_info["overall_entity_mentions_count"]
-        entity_rate = entity_info["overall_entity_mention_rate"]
-        h2h = h2h_values(
-            highcharts_count=overall_highcharts_count,
-            highcharts_rate=overall_highcharts_rate,
-            entity_key=item.key,
-            entity_count=entity_count,
-            entity_rate=entity_rate,
+    for query_row in query_rows:
+        query = query_row["query"]
+        append_entity_rows(
+            source_row=query_row,
+            query=query,
+            is_overall=False,
+            ai_score=query_scores.get(query, 0.0),
+            highcharts_rate=to_float(query_row.get(f"{HIGHCHARTS_KEY}_rate")),
         )
 
-        row = {
-            "query": "OVERALL",
-            "entity": entity_info["entity"],
-            "entity_key": item.key,
-            "is_highcharts": "yes" if item.key == HIGHCHARTS_KEY else "no",
-            "is_competitor_excl_highcharts": (
-                "no" if item.key == HIGHCHARTS_KEY else "yes"
-            ),
-            "is_overall_row": "yes",
-            "query_runs": overall_runs,
-            "mentions_count": entity_count,
-            "mentions_rate": round(entity_rate, 6),
-            "ai_visibility_query_score": f"{overall_score:.2f}",
-            "mentioned_yes": "yes" if entity_count > 0 else "no",
-            "query_citation_count": to_int(overall_row.get("citation_count")),
-            "query_viability_raw_count": to_int(overall_row.get("viability_index_count")),
-            "query_viability_raw_rate": round(
-                to_float(overall_row.get("viability_index_rate")), 6
-            ),
-            "query_viability_excl_highcharts_count": excl_count,
-            "query_viability_excl_highcharts_rate": excl_rate,
-            "window_start_utc": context["window_start_utc"],
-            "window_end_utc": context["window_end_utc"],
-            "date_dd_mm_yyyy": format_dd_mm_yyyy(context["window_end_utc"]),
-            "models": context["models"],
-            "model_owners": context.get("model_owners", ""),
-            "model_owner_map": context.get("model_owner_map", ""),
-            "web_search_enabled": overall_web,
-            "highcharts_query_mentions_count": overall_highcharts_count,
-            "highcharts_query_mentions_rate": round(overall_highcharts_rate, 6),
-            "h2h_highcharts_share_score": h2h["h2h_highcharts_share_score"],
-            "h2h_competitor_share_score": h2h["h2h_competitor_share_score"],
-            "h2h_gap_rate_highcharts_minus_entity": h2h[
-                "h2h_gap_rate_highcharts_minus_entity"
-            ],
-            "h2h_winner": h2h["h2h_winner"],
-            "is_overall_entity_row": "yes",
-            "entity_chart_sort": entity_info["entity_chart_sort"],
-            "entity_color_hex": entity_info["entity_color_hex"],
-            "overall_entity_mentions_count": entity_info["overall_entity_mentions_count"],
-            "overall_entity_mention_rate": entity_info["overall_entity_mention_rate"],
-            "overall_entity_mention_rate_pct": entity_info[
-                "overall_entity_mention_rate_pct"
-            ],
-            "overall_entity_mention_rate_label": entity_info[
-                "overall_entity_mention_rate_label"
-            ],
-            "run_month": run_month,
-            "run_id": run_id,
-        }
-        add_entity_snapshot_fields(
-            row=row,
-            source_row=overall_row,
-            entity_meta=entity_meta,
-        )
-        all_rows.append(row)
+    # Add one OVERALL row per entity for simple chart filtering in Looker. Its
+    # Highcharts rate is recomputed from the count rather than read from the CSV.
+    append_entity_rows(
+        source_row=overall_row,
+        query="OVERALL",
+        is_overall=True,
+        ai_score=overall_score,
+        highcharts_rate=compute_mention_rate(
+            to_int(overall_row.get(f"{HIGHCHARTS_KEY}_count")),
+            overall_row.get("runs"),
+        ),
+    )
 
     query_order = {
         row["query"]: index for index, row in enumerate(query_rows, start=1)
@@ -836,16 +813,19 @@ def build_rows(
     return all_rows, overall_score
 
 
+def entity_snapshot_fieldnames(entity_key: str) -> Tuple[str, str, str]:
+    return (
+        f"{entity_key}_query_mentions_count",
+        f"{entity_key}_query_mentions_rate",
+        f"{entity_key}_query_mentioned_yes",
+    )
+
+
 def build_entity_snapshot_fieldnames(entity_meta: Sequence[EntityMeta]) -> List[str]:
     fields: List[str] = []
     existing = set(LOOKER_BASE_FIELDNAMES)
     for item in entity_meta:
-        key = item.key
-        for field_name in (
-            f"{key}_query_mentions_count",
-            f"{key}_query_mentions_rate",
-            f"{key}_query_mentioned_yes",
-        ):
+        for field_name in entity_snapshot_fieldnames(item.key):
             if field_name in existing:
                 continue
             existing.add(field_name)
@@ -853,32 +833,57 @@ def build_entity_snapshot_fieldnames(entity_meta: Sequence[EntityMeta]) -> List[
     return fields
 
 
-def add_entity_snapshot_fields(
-    row: Dict[str, Any],
+def entity_snapshot_fields(
     source_row: Dict[str, str],
     entity_meta: Sequence[EntityMeta],
-) -> None:
+) -> Dict[str, Any]:
+    fields: Dict[str, Any] = {}
+    runs = source_row.get("runs")
     for item in entity_meta:
         key = item.key
         count = to_int(source_row.get(f"{key}_count"))
-        rate = compute_mention_rate(count, source_row.get("runs"))
+        rate = compute_mention_rate(count, runs)
         yes_value = source_row.get(f"{key}_yes")
         if yes_value in (None, ""):
             yes = "yes" if count > 0 else "no"
         else:
             yes = normalize_yes_no(yes_value)
 
-        row[f"{key}_query_mentions_count"] = count
-        row[f"{key}_query_mentions_rate"] = rate
-        row[f"{key}_query_mentioned_yes"] = yes
+        count_field, rate_field, yes_field = entity_snapshot_fieldnames(key)
+        fields[count_field] = count
+        fields[rate_field] = rate
+        fields[yes_field] = yes
+    return fields
 
 
-def write_csv(path: Path, rows: List[Dict[str, Any]], fieldnames: Sequence[str]) -> None:
+def write_csv(
+    path: Path, rows: Iterable[Dict[str, Any]], fieldnames: Sequence[str]
+) -> None:
+    """Write rows under a fieldnames header with csv.writer.
+
+    Fields missing from a row are written as "". A row with a key outside
+    fieldnames raises ValueError, as csv.DictWriter does by default. Every
+    row is checked; rows go to a temporary sibling that replaces path only
+    once all of them are written, so on error an existing file is untouched.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", newline="", encoding="utf-8") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+    header = frozenset(fieldnames)
+    temp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        with temp_path.open("w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(fieldnames)
+            for row in rows:
+                if not header.issuperset(row):
+                    raise ValueError(
+                        "dict contains fields not in fieldnames: "
+                        + ", ".join(repr(key) for key in row if key not in header)
+                    )
+                writer.writerow([row.get(field, "") for field in fieldnames])
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
 
 
 def write_kpi_csv(
@@ -924,6 +929,7 @@ def build_competitor_metric_rows(
         row.get("query", ""): index for index, row in enumerate(comparison_rows, start=1)
     }
     rows: List[Dict[str, Any]] = []
+    date_dd_mm_yyyy = format_dd_mm_yyyy(context["window_end_utc"])
 
     for query_row in comparison_rows:
         query = str(query_row.get("query", ""))
@@ -931,12 +937,12 @@ def build_competitor_metric_rows(
         web_search_enabled = normalize_yes_no(query_row.get("web_search_enabled"))
         is_overall = "yes" if query == "OVERALL" else "no"
 
-        total_mentions = sum(
+        mention_counts = [
             to_int(query_row.get(f"{item.key}_count")) for item in entity_meta
-        )
+        ]
+        total_mentions = sum(mention_counts)
 
-        for item in entity_meta:
-            mentions_count = to_int(query_row.get(f"{item.key}_count"))
+        for item, mentions_count in zip(entity_meta, mention_counts):
             mentions_rate = compute_mention_rate(mentions_count, query_row.get("runs"))
             share_of_voice_rate = compute_share_of_voice_rate(
                 mentions_count,
@@ -956,7 +962,7 @@ def build_competitor_metric_rows(
                 "share_of_voice_rate_pct": round(share_of_voice_rate * 100.0, 2),
                 "window_start_utc": context["window_start_utc"],
                 "window_end_utc": context["window_end_utc"],
-                "date_dd_mm_yyyy": format_dd_mm_yyyy(context["window_end_utc"]),
+                "date_dd_mm_yyyy": date_dd_mm_yyyy,
                 "models": context["models"],
                 "model_owners": context.get("model_owners", ""),
                 "model_owner_map": context.get("model_owner_map", ""),
@@ -1014,8 +1020,7 @@ def main(argv: Sequence[str] | None = None) -> int:
     labels_by_key = infer_entity_labels(viability_rows, entity_keys)
     entity_meta = build_entity_meta(entity_keys, labels_by_key)
 
-    jsonl_rows = read_jsonl_rows(jsonl_path)
-    context = extract_context(jsonl_rows)
+    context = extract_context(iter_jsonl_rows(jsonl_path))
     run_month = args.run_month.strip() or datetime.now().strftime("%Y-%m")
     run_id = args.run_id.strip() or str(uuid.uuid4())
 
@@ -4,20 +4,44 @@
 from __future__ import annotations
 
 import argparse
+import base64
 import csv
+import email.utils
+import functools
+import hashlib
+import http.client
 import json
 import os
+import random
 import re
+import select
+import sqlite3
 import sys
+import threading
 import time
-import urllib.error
 import urllib.parse
 import urllib.request
 from collections import Counter
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, closing
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Sequence
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+)
+
+try:
+    import orjson
+except ImportError:  # Optional: JSONL records fall back to the stdlib encoder.
+    orjson = None
 
 from .paths import ARTIFACTS_DIR, CONFIG_DIR
 
@@ -79,6 +103,13 @@ USER_PROMPT_TEMPLATE = (
 )
 MAX_ATTEMPTS = 3
 BACKOFF_BASE_SECONDS = 1.0
+MAX_BACKOFF_SECONDS = 30.0
+# Upper bound on a server-requested Retry-After. A longer wait (e.g. a daily
+# quota reset) would stall a run, and its worker thread, for far longer than
+# the remaining attempts are worth; the capped retry usually just fails fast.
+MAX_RETRY_AFTER_SECONDS = 120.0
+JSONL_FLUSH_INTERVAL_SECONDS = 1.0
+JSONL_BUFFER_BYTES = 64 * 1024
 GEMINI_GENERATE_CONTENT_API_ROOT = (
     "https://generativelanguage.googleapis.com/v1beta/models"
 )
@@ -98,7 +129,20 @@ OPENAI_COMPATIBLE_PROVIDER_BASE_URLS = {
 }
 
 
-@dataclass(frozen=True)
+MENTION_BOUNDARY_BEFORE = r"(?<![A-Za-z0-9])"
+MENTION_BOUNDARY_AFTER = r"(?![A-Za-z0-9])"
+NEVER_MATCHING_PATTERN = re.compile(r"(?!)")
+SLUG_SEPARATOR_PATTERN = re.compile(r"[^a-z0-9]+")
+# str.splitlines() (used by the JSONL readers) also breaks on these, so they
+# must stay escaped when records are written as UTF-8.
+JSONL_LINE_BREAK_ESCAPES_UTF8 = (
+    ("\x85".encode(), b"\\u0085"),
+    ("\u2028".encode(), b"\\u2028"),
+    ("\u2029".encode(), b"\\u2029"),
+)
+
+
+@dataclass(frozen=True, slots=True)
 class EntitySpec:
     key: str
     label: str
@@ -107,9 +151,15 @@ class EntitySpec:
 
 
 class ProviderRequestError(RuntimeError):
-    def __init__(self, message: str, status_code: int | None = None) -> None:
+    def __init__(
+        self,
+        message: str,
+        status_code: int | None = None,
+        retry_after: str | None = None,
+    ) -> None:
         super().__init__(message)
         self.status_code = status_code
+        self.retry_after = retry_after
 
 
 def get_system_prompt_for_provider(provider: str) -> str:
@@ -118,9 +168,119 @@ def get_system_prompt_for_provider(provider: str) -> str:
     return SYSTEM_PROMPT
 
 
+def encode_json_bytes(payload: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload)
+        except orjson.JSONEncodeError:
+            pass  # e.g. lone surrogates or oversized ints; stdlib handles them.
+    return json.dumps(payload).encode("utf-8")
+
+
+def decode_json(raw: bytes | str) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN, a BOM or oversized ints; let the stdlib decide.
+    return json.loads(raw)
+
+
+def _socket_dropped(sock: Any) -> bool:
+    # An idle keep-alive socket has nothing to read until the server closes it,
+    # so readable here means EOF (or stray bytes) and the socket is unusable.
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
 class GeminiRestClient:
     def __init__(self, api_key: str) -> None:
         self.api_key = api_key
+        root = urllib.parse.urlsplit(GEMINI_GENERATE_CONTENT_API_ROOT)
+        self._host = root.netloc
+        self._base_path = root.path
+        self._key_query = f"?key={urllib.parse.quote(api_key, safe='')}"
+        self._model_paths: Dict[str, str] = {}
+        # One keep-alive HTTPS connection per thread, so repeated calls reuse
+        # the TCP and TLS session and pooled threads never share a socket.
+        # Every connection is also listed so close() can reach other threads'.
+        self._local = threading.local()
+        self._connections: List[http.client.HTTPSConnection] = []
+        self._connections_lock = threading.Lock()
+
+    def _connection(self) -> http.client.HTTPSConnection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # proxy_bypass() applies NO_PROXY to the API host.
+            proxy = urllib.request.getproxies().get("https")
+            if proxy and not urllib.request.proxy_bypass(self._host):
+                connection = self._tunnel_connection(proxy)
+            else:
+                connection = http.client.HTTPSConnection(self._host, timeout=90)
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        elif connection.sock is not None and _socket_dropped(connection.sock):
+            # The server closed the idle kept-alive socket. Reconnect before
+            # sending, since a POST that fails after its bytes are written may
+            # already have run and must not be sent again blindly.
+            connection.close()
+        return connection
+
+    def _tunnel_connection(self, proxy: str) -> http.client.HTTPSConnection:
+        # Proxy settings may omit the scheme ("proxy:3128") and may carry
+        # credentials, which belong in the CONNECT request, not the host.
+        parts = urllib.parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+        connection = http.client.HTTPSConnection(
+            parts.hostname, parts.port, timeout=90
+        )
+        headers: Dict[str, str] = {}
+        if parts.username is not None:
+            credentials = "{}:{}".format(
+                urllib.parse.unquote(parts.username),
+                urllib.parse.unquote(parts.password or ""),
+            )
+            token = base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+            headers["Proxy-Authorization"] = f"Basic {token}"
+        connection.set_tunnel(self._host, headers=headers)
+        return connection
+
+    def _post(self, path: str, body: bytes) -> tuple[int, bytes, str | None]:
+        connection = self._connection()
+        try:
+            connection.request(
+                "POST",
+                path,
+                body=body,
+                headers={"Content-Type": "application/json"},
+            )
+            response = connection.getresponse()
+            return (
+                response.status,
+                response.read(),
+                response.getheader("Retry-After"),
+            )
+        except (http.client.HTTPException, OSError):
+            # The next call on this thread reconnects the same connection.
+            connection.close()
+            raise
+
+    def close(self) -> None:
+        with self._connections_lock:
+            for connection in self._connections:
+                connection.close()
+
+    def _request_path(self, model: str) -> str:
+        # Benchmarks call a handful of models many times; quote each path once.
+        path = self._model_paths.get(model)
+        if path is None:
+            model_path = urllib.parse.quote(model, safe="")
+            path = f"{self._base_path}/{model_path}:generateContent{self._key_query}"
+            self._model_paths[model] = path
+        return path
 
     def generate_content(
         self,
@@ -130,54 +290,43 @@ class GeminiRestClient:
         user_prompt: str,
         temperature: float | None = None,
     ) -> Dict[str, Any]:
-        model_path = urllib.parse.quote(model, safe="")
-        endpoint = (
-            f"{GEMINI_GENERATE_CONTENT_API_ROOT}/{model_path}:generateContent"
-            f"?key={urllib.parse.quote(self.api_key, safe='')}"
-        )
+        path = self._request_path(model)
         payload = {
             "systemInstruction": {"parts": [{"text": system_prompt}]},
             "contents": [{"role": "user", "parts": [{"text": user_prompt}]}],
         }
         if temperature is not None:
             payload["generationConfig"] = {"temperature": temperature}
-        request = urllib.request.Request(
-            endpoint,
-            data=json.dumps(payload).encode("utf-8"),
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
         try:
-            with urllib.request.urlopen(request, timeout=90) as response:
-                raw = response.read().decode("utf-8")
-        except urllib.error.HTTPError as exc:
-            status_code = int(getattr(exc, "code", 0) or 0)
-            raw_error = ""
-            try:
-                raw_error = exc.read().decode("utf-8")
-            except Exception:  # noqa: BLE001
-                raw_error = ""
+            status_code, raw_bytes, retry_after = self._post(
+                path, encode_json_bytes(payload)
+            )
+        except (http.client.HTTPException, OSError) as exc:
+            raise ProviderRequestError(
+                f"Gemini request failed: {exc}",
+                status_code=None,
+            ) from exc
+
+        if status_code >= 400:
             message = f"Gemini request failed ({status_code})."
             try:
-                parsed = json.loads(raw_error) if raw_error else {}
+                parsed = decode_json(raw_bytes) if raw_bytes.strip() else {}
                 if isinstance(parsed, dict):
                     candidate_message = parsed.get("error", {}).get("message")
                     if isinstance(candidate_message, str) and candidate_message.strip():
                         message = candidate_message.strip()
-            except json.JSONDecodeError:
+            except ValueError:
                 pass
-            raise ProviderRequestError(message, status_code=status_code) from exc
-        except urllib.error.URLError as exc:
             raise ProviderRequestError(
-                f"Gemini request failed: {exc}",
-                status_code=None,
-            ) from exc
+                message, status_code=status_code, retry_after=retry_after
+            )
 
-        if not raw.strip():
+        if not raw_bytes.strip():
             return {}
         try:
-            parsed = json.loads(raw)
-        except json.JSONDecodeError as exc:
+            # Parse the body bytes directly; no intermediate str decode.
+            parsed = decode_json(raw_bytes)
+        except ValueError as exc:
             raise ProviderRequestError("Gemini returned invalid JSON.") from exc
         if not isinstance(parsed, dict):
             return {}
@@ -243,6 +392,31 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
             "0 means run all prompts."
         ),
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help=(
+            "Number of LLM calls to run in parallel per provider (default: 1, "
+            "which runs every call sequentially, across providers too). Output "
+            "order is unchanged; mind provider rate limits when raising it."
+        ),
+    )
+    parser.add_argument(
+        "--cache-path",
+        default="",
+        help=(
+            "Optional SQLite file caching successful responses. Reruns with the "
+            "same model, prompt, settings, and run number replay the cached "
+            "response instead of calling the API."
+        ),
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=0,
+        help="Maximum age in seconds of reused cache entries (0 = no expiry).",
+    )
     return parser.parse_args(argv)
 
 
@@ -260,42 +434,30 @@ def parse_model_names(raw_models: str) -> List[str]:
     return parsed if parsed else ["gpt-4o-mini"]
 
 
+@functools.lru_cache(maxsize=1024)
 def slugify(value: str) -> str:
-    slug = re.sub(r"[^a-z0-9]+", "_", value.lower()).strip("_")
+    slug = SLUG_SEPARATOR_PATTERN.sub("_", value.lower()).strip("_")
     return slug or "entity"
 
 
 def dedupe_preserve_order(items: Iterable[str]) -> List[str]:
-    seen = set()
-    output = []
+    # Insertion-ordered dict keyed on the lowercased value; the first spelling
+    # of each value wins.
+    deduped: Dict[str, str] = {}
     for item in items:
         normalized = item.strip()
-        if not normalized:
-            continue
-        key = normalized.lower()
-        if key in seen:
-            continue
-        seen.add(key)
-        output.append(normalized)
-    return output
+        if normalized:
+            deduped.setdefault(normalized.lower(), normalized)
+    return list(deduped.values())
 
 
 def normalize_competitor_names(competitors: Iterable[str]) -> List[str]:
-    normalized: List[str] = []
-    seen = set()
-    for raw in competitors:
-        value = str(raw).strip()
-        if not value:
-            continue
-        lowered = value.lower()
-        canonical = "Highcharts" if lowered == "highcharts" else value
-        if lowered in seen:
-            continue
-        seen.add(lowered)
-        normalized.append(canonical)
-
-    if "highcharts" not in seen:
-        normalized.insert(0, "Highcharts")
+    normalized = dedupe_preserve_order(str(raw) for raw in competitors)
+    for index, name in enumerate(normalized):
+        if name.lower() == "highcharts":
+            normalized[index] = "Highcharts"
+            return normalized
+    normalized.insert(0, "Highcharts")
     return normalized
 
 
@@ -344,7 +506,7 @@ def load_benchmark_config(
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
     try:
-        raw_config = json.loads(config_path.read_text(encoding="utf-8"))
+        raw_config = decode_json(config_path.read_bytes())
     except json.JSONDecodeError as exc:
         raise RuntimeError(f"Invalid JSON in config file: {config_path}") from exc
 
@@ -421,25 +583,155 @@ def build_entity_specs(
     return specs
 
 
-def alias_to_pattern(alias: str) -> re.Pattern[str]:
+def alias_to_pattern_body(alias: str) -> str:
     escaped_chunks = [re.escape(chunk) for chunk in alias.split()]
-    body = r"\s+".join(escaped_chunks)
-    return re.compile(rf"(?<![A-Za-z0-9]){body}(?![A-Za-z0-9])", re.IGNORECASE)
+    return r"\s+".join(escaped_chunks)
+
+
+def alias_to_pattern(alias: str) -> re.Pattern[str]:
+    body = alias_to_pattern_body(alias)
+    return re.compile(
+        f"{MENTION_BOUNDARY_BEFORE}{body}{MENTION_BOUNDARY_AFTER}", re.IGNORECASE
+    )
+
+
+class CompiledEntityPatterns(Dict[str, re.Pattern[str]]):
+    """Per-entity mention patterns plus one scanner over all entities."""
+
+    scanner: re.Pattern[str] | None = None
+    group_keys: Dict[str, str]
+    # Case-sensitive twins of the patterns above for lowercased ASCII text; None
+    # when an alias is non-ASCII and lowercasing cannot mirror IGNORECASE.
+    ascii_patterns: Dict[str, re.Pattern[str]] | None = None
+    ascii_scanner: re.Pattern[str] | None = None
+
+    def copy(self) -> CompiledEntityPatterns:
+        copied = CompiledEntityPatterns(self)
+        copied.__dict__.update(self.__dict__)
+        return copied
+
+
+def _compile_entity_alternations(
+    alternations: Dict[str, str], flags: int
+) -> tuple[Dict[str, re.Pattern[str]], re.Pattern[str] | None, Dict[str, str]]:
+    patterns: Dict[str, re.Pattern[str]] = {}
+    group_keys: Dict[str, str] = {}
+    scanner_branches: List[str] = []
+    for key, alternation in alternations.items():
+        patterns[key] = re.compile(
+            f"{MENTION_BOUNDARY_BEFORE}(?:{alternation}){MENTION_BOUNDARY_AFTER}",
+            flags,
+        )
+        # Entity keys may start with a digit, so groups get positional names.
+        group_name = f"entity_{len(scanner_branches)}"
+        group_keys[group_name] = key
+        scanner_branches.append(f"(?P<{group_name}>{alternation})")
+    if not scanner_branches:
+        return patterns, None, group_keys
+    # Both boundaries are shared by every branch; if the trailing one fails,
+    # the engine backtracks into the next branch as per-branch checks would.
+    scanner = re.compile(
+        f"{MENTION_BOUNDARY_BEFORE}(?=(?:"
+        + "|".join(scanner_branches)
+        + f"){MENTION_BOUNDARY_AFTER})",
+        flags,
+    )
+    return patterns, scanner, group_keys
+
 
+def compile_entity_patterns(specs: Sequence[EntitySpec]) -> CompiledEntityPatterns:
+    # Runs, worker jobs and tests keep compiling the same entity sets. This is
+    # the one memoization layer for mention regexes: the compiled state is
+    # cached per alias signature, and each caller gets a shallow copy of the
+    # mapping (the regexes themselves are immutable and shared) so per-caller
+    # tweaks never leak into the cache.
+    signature = tuple((spec.key, tuple(spec.aliases)) for spec in specs)
+    return _compile_entity_patterns_cached(signature).copy()
 
-def compile_entity_patterns(specs: Sequence[EntitySpec]) -> Dict[str, List[re.Pattern[str]]]:
-    compiled: Dict[str, List[re.Pattern[str]]] = {}
+
+@functools.lru_cache(maxsize=16)
+def _compile_entity_patterns_cached(
+    signature: tuple[tuple[str, tuple[str, ...]], ...],
+) -> CompiledEntityPatterns:
+    # Only key and aliases shape the patterns, so they stand in for the specs.
+    specs = [
+        EntitySpec(key=key, label=key, aliases=list(aliases), is_competitor=True)
+        for key, aliases in signature
+    ]
+    # One alternation per entity, and one zero-width union of those alternations
+    # so detect_mentions can scan the text once for every entity.
+    compiled = CompiledEntityPatterns()
+    alternations: Dict[str, str] = {}
+    ascii_alternations: Dict[str, str] | None = {}
     for spec in specs:
-        compiled[spec.key] = [alias_to_pattern(alias) for alias in spec.aliases]
+        # Placeholder first so keys (and detect_mentions output) keep spec order.
+        compiled[spec.key] = NEVER_MATCHING_PATTERN
+        aliases = [alias for alias in spec.aliases if alias.split()]
+        if not aliases:
+            continue
+        # Aliases differing only in spacing share a body ("chart js" and
+        # "chart  js"); each distinct body becomes one branch.
+        alternations[spec.key] = "|".join(
+            dict.fromkeys(alias_to_pattern_body(alias) for alias in aliases)
+        )
+        if ascii_alternations is not None and all(a.isascii() for a in aliases):
+            ascii_alternations[spec.key] = "|".join(
+                dict.fromkeys(alias_to_pattern_body(alias.lower()) for alias in aliases)
+            )
+        else:
+            ascii_alternations = None
+
+    patterns, compiled.scanner, compiled.group_keys = _compile_entity_alternations(
+        alternations, re.IGNORECASE
+    )
+    compiled.update(patterns)
+    if ascii_alternations is not None:
+        compiled.ascii_patterns, compiled.ascii_scanner, _ = (
+            _compile_entity_alternations(ascii_alternations, 0)
+        )
     return compiled
 
 
 def detect_mentions(
-    text: str, compiled_patterns: Dict[str, List[re.Pattern[str]]]
+    text: str, compiled_patterns: Dict[str, re.Pattern[str]]
 ) -> Dict[str, bool]:
-    mentions: Dict[str, bool] = {}
-    for key, patterns in compiled_patterns.items():
-        mentions[key] = any(pattern.search(text) for pattern in patterns)
+    scanner = getattr(compiled_patterns, "scanner", None)
+    if scanner is None:
+        return {
+            key: pattern.search(text) is not None
+            for key, pattern in compiled_patterns.items()
+        }
+
+    patterns: Dict[str, re.Pattern[str]] = compiled_patterns
+    ascii_patterns = compiled_patterns.ascii_patterns
+    if ascii_patterns is not None and text.isascii():
+        # Lowercase ASCII text once and match case-sensitive patterns instead of
+        # case-folding every character inside the regex engine. ASCII
+        # lowercasing keeps offsets aligned with the original text.
+        text = text.lower()
+        patterns = ascii_patterns
+        scanner = compiled_patterns.ascii_scanner
+
+    mentions = dict.fromkeys(compiled_patterns, False)
+    pending = {
+        key: patterns[key]
+        for key, pattern in compiled_patterns.items()
+        if pattern is not NEVER_MATCHING_PATTERN
+    }
+    group_keys = compiled_patterns.group_keys
+    for match in scanner.finditer(text):
+        # The lookahead reports only the first entity matching at this offset;
+        # other pending entities may start at the same offset too.
+        found_key = group_keys[match.lastgroup]
+        if pending.pop(found_key, None) is not None:
+            mentions[found_key] = True
+        position = match.start()
+        for key, pattern in list(pending.items()):
+            if pattern.match(text, position) is not None:
+                del pending[key]
+                mentions[key] = True
+        if not pending:
+            break
     return mentions
 
 
@@ -494,6 +786,7 @@ def create_minimax_client(api_key: str) -> Any:
     )
 
 
+@functools.lru_cache(maxsize=256)
 def infer_provider_from_model(model: str) -> str:
     normalized = str(model).strip().lower()
     if normalized.startswith("claude") or normalized.startswith("anthropic/"):
@@ -585,48 +878,38 @@ def normalize_api_key(raw_value: str | None) -> str:
     return value
 
 
+TRANSIENT_ERROR_CLASS_TOKENS = frozenset(
+    {"ratelimit", "timeout", "connection", "internalserver", "serviceunavailable"}
+)
+TRANSIENT_ERROR_MESSAGE_PATTERN = re.compile(
+    r"rate limit|timed out|timeout|connection|temporarily unavailable|server error"
+    r"|status code: (?:429|50[0-4])",
+    re.IGNORECASE,
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _is_transient_error_class(class_name: str) -> bool:
+    lowered = class_name.lower()
+    return any(token in lowered for token in TRANSIENT_ERROR_CLASS_TOKENS)
+
+
+def _is_transient_status(status_code: Any) -> bool:
+    return isinstance(status_code, int) and (status_code == 429 or status_code >= 500)
+
+
 def is_transient_error(exc: Exception) -> bool:
-    class_name = exc.__class__.__name__.lower()
-    if any(
-        token in class_name
-        for token in (
-            "ratelimit",
-            "timeout",
-            "connection",
-            "internalserver",
-            "serviceunavailable",
-        )
-    ):
+    if _is_transient_error_class(exc.__class__.__name__):
         return True
 
-    status_code = getattr(exc, "status_code", None)
-    if isinstance(status_code, int) and (status_code == 429 or status_code >= 500):
+    if _is_transient_status(getattr(exc, "status_code", None)):
         return True
 
     response = getattr(exc, "response", None)
-    response_status = getattr(response, "status_code", None)
-    if isinstance(response_status, int) and (
-        response_status == 429 or response_status >= 500
-    ):
+    if _is_transient_status(getattr(response, "status_code", None)):
         return True
 
-    message = str(exc).lower()
-    return any(
-        token in message
-        for token in (
-            "rate limit",
-            "timed out",
-            "timeout",
-            "connection",
-            "temporarily unavailable",
-            "server error",
-            "status code: 429",
-            "status code: 500",
-            "status code: 502",
-            "status code: 503",
-            "status code: 504",
-        )
-    )
+    return TRANSIENT_ERROR_MESSAGE_PATTERN.search(str(exc)) is not None
 
 
 def _is_temperature_parameter_error(exc: Exception) -> bool:
@@ -653,24 +936,47 @@ def _is_temperature_parameter_error(exc: Exception) -> bool:
     )
 
 
+def _model_dump_to_dict(response_obj: Any) -> Any:
+    model_dump = response_obj.model_dump
+    try:
+        return model_dump(mode="python")
+    except TypeError:
+        return model_dump()
+
+
+def _to_dict_to_dict(response_obj: Any) -> Any:
+    return response_obj.to_dict()
+
+
+def _vars_to_dict(response_obj: Any) -> Any:
+    return response_obj.__dict__
+
+
+PLAIN_DICT_CONVERTERS: tuple[tuple[str, Callable[[Any], Any]], ...] = (
+    ("model_dump", _model_dump_to_dict),
+    ("to_dict", _to_dict_to_dict),
+    ("__dict__", _vars_to_dict),
+)
+# SDKs return the same response class on every call, so the converter that
+# worked for a type is remembered and tried first next time.
+_plain_dict_converter_by_type: Dict[type, Callable[[Any], Any]] = {}
+
+
 def to_plain_dict(response_obj: Any) -> Dict[str, Any]:
     if isinstance(response_obj, dict):
         return response_obj
-    if hasattr(response_obj, "model_dump"):
-        model_dump = getattr(response_obj, "model_dump")
-        try:
-            data = model_dump(mode="python")
-        except TypeError:
-            data = model_dump()
-        if isinstance(data, dict):
-            return data
-    if hasattr(response_obj, "to_dict"):
-        data = response_obj.to_dict()
+    response_type = type(response_obj)
+    cached = _plain_dict_converter_by_type.get(response_type)
+    if cached is not None:
+        data = cached(response_obj)
         if isinstance(data, dict):
             return data
-    if hasattr(response_obj, "__dict__"):
-        data = response_obj.__dict__
+    for attr_name, converter in PLAIN_DICT_CONVERTERS:
+        if converter is cached or not hasattr(response_obj, attr_name):
+            continue
+        data = converter(response_obj)
         if isinstance(data, dict):
+            _plain_dict_converter_by_type[response_type] = converter
             return data
     return {}
 
@@ -791,8 +1097,9 @@ def infer_citation_provider(response_dict: Dict[str, Any]) -> str:
 
 
 def extract_citations(response_dict: Dict[str, Any]) -> List[Dict[str, Any]]:
-    citations: List[Dict[str, Any]] = []
-    seen = set()
+    # Keyed on the dedupe key; dicts keep first-seen order, so no parallel
+    # "seen" set is needed.
+    citations: Dict[tuple[Any, ...], Dict[str, Any]] = {}
     provider = infer_citation_provider(response_dict)
 
     def append(raw: Dict[str, Any], source_text: str = "") -> None:
@@ -805,12 +1112,16 @@ def extract_citations(response_dict: Dict[str, Any]) -> List[Dict[str, Any]]:
         )
         if not isinstance(url, str) or not url.strip():
             return
-        title = raw.get("title") or raw.get("source") or ""
-        snippet = raw.get("snippet") or raw.get("text") or ""
+        url = url.strip()
+        title = str(raw.get("title") or raw.get("source") or "").strip()
         start_index = normalize_citation_bound(
             raw.get("start_index", raw.get("startIndex"))
         )
         end_index = normalize_citation_bound(raw.get("end_index", raw.get("endIndex")))
+        dedupe_key = (url, title, start_index, end_index)
+        if dedupe_key in citations:
+            return
+        snippet = raw.get("snippet") or raw.get("text") or ""
         host = normalize_citation_host(url)
         anchor_text = raw.get("anchor_text", raw.get("anchorText"))
         if not isinstance(anchor_text, str):
@@ -824,9 +1135,9 @@ def extract_citations(response_dict: Dict[str, Any]) -> List[Dict[str, Any]]:
             and end_index <= len(source_text)
         ):
             anchor_text = source_text[start_index:end_index].strip()
-        entry = {
-            "title": str(title).strip(),
-            "url": url.strip(),
+        citations[dedupe_key] = {
+            "title": title,
+            "url": url,
             "snippet": str(snippet).strip(),
             "host": host,
             "start_index": start_index,
@@ -834,16 +1145,6 @@ def extract_citations(response_dict: Dict[str, Any]) -> List[Dict[str, Any]]:
             "anchor_text": anchor_text.strip() if isinstance(anchor_text, str) else "",
             "provider": str(raw.get("provider") or provider).strip().lower() or provider,
         }
-        dedupe_key = (
-            entry["url"],
-            entry["title"],
-            entry.get("start_index"),
-            entry.get("end_index"),
-        )
-        if dedupe_key in seen:
-            return
-        seen.add(dedupe_key)
-        citations.append(entry)
 
     for key in ("citations", "sources", "references"):
         value = response_dict.get(key)
@@ -863,11 +1164,12 @@ def extract_citations(response_dict: Dict[str, Any]) -> List[Dict[str, Any]]:
             for content in content_items:
                 if not isinstance(content, dict):
                     continue
+                source_text = str(content.get("text") or "")
                 content_citations = content.get("citations")
                 if isinstance(content_citations, list):
                     for candidate in content_citations:
                         if isinstance(candidate, dict):
-                            append(candidate, source_text=str(content.get("text") or ""))
+                            append(candidate, source_text=source_text)
                 annotations = content.get("annotations")
                 if not isinstance(annotations, list):
                     continue
@@ -875,10 +1177,10 @@ def extract_citations(response_dict: Dict[str, Any]) -> List[Dict[str, Any]]:
                     if not isinstance(annotation, dict):
                         continue
                     if "citation" in str(annotation.get("type", "")).lower():
-                        append(annotation, source_text=str(content.get("text") or ""))
+                        append(annotation, source_text=source_text)
                     nested = annotation.get("url_citation")
                     if isinstance(nested, dict):
-                        append(nested, source_text=str(content.get("text") or ""))
+                        append(nested, source_text=source_text)
 
     content_items = response_dict.get("content", [])
     if isinstance(content_items, list):
@@ -887,9 +1189,10 @@ def extract_citations(response_dict: Dict[str, Any]) -> List[Dict[str, Any]]:
                 continue
             content_citations = content.get("citations")
             if isinstance(content_citations, list):
+                source_text = str(content.get("text") or "")
                 for candidate in content_citations:
                     if isinstance(candidate, dict):
-                        append(candidate, source_text=str(content.get("text") or ""))
+                        append(candidate, source_text=source_text)
 
     candidates = response_dict.get("candidates", [])
     if isinstance(candidates, list):
@@ -916,18 +1219,24 @@ def extract_citations(response_dict: Dict[str, Any]) -> List[Dict[str, Any]]:
                         if isinstance(source, dict):
                             append(source)
 
-    citations.sort(
+    return sorted(
+        citations.values(),
         key=lambda item: (
             item.get("end_index")
             if isinstance(item.get("end_index"), int)
             else sys.maxsize,
             str(item.get("url", "")),
-        )
+        ),
     )
-    return citations
 
 
 def to_non_negative_int(value: Any) -> int:
+    # Usage fields are normally ints or absent; skip the float round trip and
+    # the TypeError raised for None in those cases.
+    if type(value) is int:
+        return value if value > 0 else 0
+    if value is None:
+        return 0
     try:
         parsed = int(float(value))
     except (TypeError, ValueError):
@@ -984,6 +1293,45 @@ def extract_token_usage(response_dict: Dict[str, Any]) -> Dict[str, int]:
     }
 
 
+def parse_retry_after(value: Any) -> float:
+    """Seconds requested by a Retry-After header value (delta or HTTP date)."""
+    if value is None:
+        return 0.0
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        try:
+            retry_at = email.utils.parsedate_to_datetime(str(value))
+        except (TypeError, ValueError):
+            return 0.0
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    # max() also maps NaN to 0.
+    return max(0.0, seconds)
+
+
+def _retry_after_from_error(exc: Exception) -> float:
+    retry_after = getattr(exc, "retry_after", None)
+    if retry_after is None:
+        # OpenAI/Anthropic SDK status errors carry the httpx response.
+        headers = getattr(getattr(exc, "response", None), "headers", None)
+        if callable(getattr(headers, "get", None)):
+            retry_after = headers.get("retry-after")
+    return parse_retry_after(retry_after)
+
+
+def retry_sleep_seconds(exc: Exception, attempt: int) -> float:
+    # Jitter over the upper half of the capped exponential backoff keeps
+    # concurrent workers that hit a rate limit together from retrying in
+    # lockstep without ever retrying immediately. A server-requested
+    # Retry-After is honored up to MAX_RETRY_AFTER_SECONDS.
+    ceiling = min(BACKOFF_BASE_SECONDS * (2 ** (attempt - 1)), MAX_BACKOFF_SECONDS)
+    backoff = random.uniform(ceiling / 2, ceiling)
+    retry_after = min(_retry_after_from_error(exc), MAX_RETRY_AFTER_SECONDS)
+    return max(backoff, retry_after)
+
+
 def generate_with_optional_retry(
     client: Any,
     provider: str,
@@ -1000,59 +1348,60 @@ def generate_with_optional_retry(
             "You must use web search before finalizing. Cite the sources you relied "
             "on in the answer."
         )
+    # Build the request once; retries and the temperature fallback only vary
+    # whether "temperature" is added on top.
+    create: Callable[..., Any]
+    payload: Dict[str, Any]
+    if provider == "anthropic":
+        create = client.messages.create
+        payload = {
+            "model": model,
+            "max_tokens": 1024,
+            "system": system_prompt,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": user_prompt,
+                }
+            ],
+        }
+    elif provider == "google":
+        create = client.generate_content
+        payload = {
+            "model": model,
+            "system_prompt": system_prompt,
+            "user_prompt": user_prompt,
+        }
+    elif provider in {"deepseek", "moonshot", "minimax"}:
+        create = client.chat.completions.create
+        payload = {
+            "model": model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+        }
+    else:
+        create = client.responses.create
+        payload = {
+            "model": model,
+            "input": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+        }
+        if web_search:
+            payload["tools"] = [{"type": "web_search_preview"}]
+
     temperature_supported = _supports_temperature_parameter(provider, model)
     for attempt in range(1, MAX_ATTEMPTS + 1):
         include_temperature = temperature_supported
         while True:
             try:
-                if provider == "anthropic":
-                    anthropic_payload: Dict[str, Any] = {
-                        "model": model,
-                        "max_tokens": 1024,
-                        "system": system_prompt,
-                        "messages": [
-                            {
-                                "role": "user",
-                                "content": user_prompt,
-                            }
-                        ],
-                    }
-                    if include_temperature:
-                        anthropic_payload["temperature"] = temperature
-                    response_obj = client.messages.create(**anthropic_payload)
-                elif provider == "google":
-                    gemini_payload: Dict[str, Any] = {
-                        "model": model,
-                        "system_prompt": system_prompt,
-                        "user_prompt": user_prompt,
-                    }
-                    if include_temperature:
-                        gemini_payload["temperature"] = temperature
-                    response_obj = client.generate_content(**gemini_payload)
-                elif provider in {"deepseek", "moonshot", "minimax"}:
-                    compatible_payload: Dict[str, Any] = {
-                        "model": model,
-                        "messages": [
-                            {"role": "system", "content": system_prompt},
-                            {"role": "user", "content": user_prompt},
-                        ],
-                    }
-                    if include_temperature:
-                        compatible_payload["temperature"] = temperature
-                    response_obj = client.chat.completions.create(**compatible_payload)
+                if include_temperature:
+                    response_obj = create(**payload, temperature=temperature)
                 else:
-                    openai_payload: Dict[str, Any] = {
-                        "model": model,
-                        "input": [
-                            {"role": "system", "content": system_prompt},
-                            {"role": "user", "content": user_prompt},
-                        ],
-                    }
-                    if include_temperature:
-                        openai_payload["temperature"] = temperature
-                    if web_search:
-                        openai_payload["tools"] = [{"type": "web_search_preview"}]
-                    response_obj = client.responses.create(**openai_payload)
+                    response_obj = create(**payload)
                 response_dict = to_plain_dict(response_obj)
                 text = extract_response_text(response_obj, response_dict)
                 citations = extract_citations(response_dict)
@@ -1067,111 +1416,331 @@ def generate_with_optional_retry(
                 retry = attempt < MAX_ATTEMPTS and is_transient_error(exc)
                 if not retry:
                     raise
-                sleep_seconds = BACKOFF_BASE_SECONDS * (2 ** (attempt - 1))
-                time.sleep(sleep_seconds)
+                time.sleep(retry_sleep_seconds(exc, attempt))
                 break
 
     raise RuntimeError("Retries exhausted unexpectedly")
 
 
-def reset_jsonl(path: Path) -> None:
-    path.write_text("", encoding="utf-8")
+class ResponseCache:
+    """SQLite store of successful responses, keyed by the full request content.
 
+    Opt-in via --cache-path so reruns during development replay earlier
+    answers instead of paying for them again. The key covers everything that
+    shapes the request plus the run slot, so each of the --runs samples of a
+    query replays its own earlier response. A replay also carries the original
+    call's timestamp, duration and token usage, so latency and cost figures
+    built from the JSONL describe real calls rather than cache reads.
+    """
 
-def append_jsonl(path: Path, record: Dict[str, Any]) -> None:
-    with path.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(record, ensure_ascii=True) + "\n")
+    def __init__(self, path: Path, ttl_seconds: float = 0.0) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            str(path), isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, text TEXT, citations TEXT, usage TEXT, ts REAL, "
+            "duration_ms INTEGER, timestamp TEXT)"
+        )
+        # Caches written before the timing columns existed gain them here; their
+        # rows have no original timing, so get() treats them as misses.
+        columns = {
+            row[1]
+            for row in self._connection.execute("PRAGMA table_info(responses)")
+        }
+        for column, kind in (("duration_ms", "INTEGER"), ("timestamp", "TEXT")):
+            if column not in columns:
+                self._connection.execute(
+                    f"ALTER TABLE responses ADD COLUMN {column} {kind}"
+                )
 
+    @staticmethod
+    def make_key(
+        *,
+        provider: str,
+        model: str,
+        query: str,
+        temperature: float,
+        web_search: bool,
+        run_slot: int,
+    ) -> str:
+        material = {
+            "provider": provider,
+            "model": model,
+            "system_prompt": get_system_prompt_for_provider(provider),
+            "user_prompt": USER_PROMPT_TEMPLATE.format(query=query),
+            "temperature": temperature,
+            "web_search": web_search,
+            "run_slot": run_slot,
+        }
+        encoded = json.dumps(material, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get(
+        self, key: str
+    ) -> tuple[str, List[Dict[str, Any]], Dict[str, int], int, str] | None:
+        min_ts = time.time() - self.ttl_seconds if self.ttl_seconds > 0 else 0.0
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT text, citations, usage, duration_ms, timestamp "
+                "FROM responses WHERE key = ? AND ts >= ? "
+                "AND duration_ms IS NOT NULL AND timestamp IS NOT NULL",
+                (key, min_ts),
+            ).fetchone()
+        if row is None:
+            return None
+        text, citations, usage, duration_ms, timestamp = row
+        return text, json.loads(citations), json.loads(usage), duration_ms, timestamp
+
+    def put(
+        self,
+        key: str,
+        text: str,
+        citations: List[Dict[str, Any]],
+        usage: Dict[str, int],
+        duration_ms: int,
+        timestamp: str,
+    ) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, text, citations, usage, ts, duration_ms, timestamp) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    text,
+                    json.dumps(citations),
+                    json.dumps(usage),
+                    time.time(),
+                    duration_ms,
+                    timestamp,
+                ),
+            )
 
-def build_comparison_rows(
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+def open_jsonl(path: Path) -> BinaryIO:
+    # A record with a long response easily exceeds the default 8 KiB buffer;
+    # a larger one keeps each record (and each flush interval) to one write.
+    return path.open("wb", buffering=JSONL_BUFFER_BYTES)
+
+
+def encode_jsonl_line(record: Dict[str, Any]) -> bytes:
+    """One newline-terminated UTF-8 JSONL line for ``record``."""
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            pass  # e.g. lone surrogates or oversized ints; stdlib handles them.
+        else:
+            if encoded.isascii():
+                return encoded
+            for raw, escaped in JSONL_LINE_BREAK_ESCAPES_UTF8:
+                if raw in encoded:
+                    encoded = encoded.replace(raw, escaped)
+            return encoded
+    return (json.dumps(record, ensure_ascii=True) + "\n").encode("ascii")
+
+
+def write_jsonl_record(handle: BinaryIO, record: Dict[str, Any]) -> None:
+    handle.write(encode_jsonl_line(record))
+
+
+def mention_mask(mentions: Dict[str, Any], keys: Sequence[str]) -> int:
+    mask = 0
+    for bit, key in enumerate(keys):
+        if mentions.get(key):
+            mask |= 1 << bit
+    return mask
+
+
+@dataclass
+class RecordTally:
+    mask_counts: Counter[int] = field(default_factory=Counter)
+    citation_count: int = 0
+
+
+def tally_records(
+    records: Sequence[Dict[str, Any]], keys: Sequence[str]
+) -> tuple[Dict[Any, RecordTally], RecordTally]:
+    """Tally mention bitmasks and citations per query and overall, in one pass."""
+    by_query: Dict[Any, RecordTally] = {}
+    overall = RecordTally()
+    for record in records:
+        mask = mention_mask(record.get("mentions", {}), keys)
+        citation_count = record.get("citation_count")
+        if citation_count is None:
+            citation_count = len(record.get("citations", []))
+        query = record.get("query")
+        query_tally = by_query.get(query)
+        if query_tally is None:
+            query_tally = by_query[query] = RecordTally()
+        query_tally.mask_counts[mask] += 1
+        query_tally.citation_count += citation_count
+        overall.mask_counts[mask] += 1
+        overall.citation_count += citation_count
+    return by_query, overall
+
+
+def mask_counts_to_entity_counts(mask_counts: Counter[int], size: int) -> List[int]:
+    # Records share few distinct mention combinations, so expanding each
+    # distinct mask once is far cheaper than probing every record per entity.
+    counts = [0] * size
+    for mask, occurrences in mask_counts.items():
+        bit = 0
+        while mask:
+            if mask & 1:
+                counts[bit] += occurrences
+            mask >>= 1
+            bit += 1
+    return counts
+
+
+def iter_comparison_rows(
     records: Sequence[Dict[str, Any]],
     specs: Sequence[EntitySpec],
     queries: Sequence[str],
     runs_per_query: int,
     web_search_enabled: bool,
-) -> List[Dict[str, Any]]:
-    rows: List[Dict[str, Any]] = []
-    competitor_keys = [spec.key for spec in specs if spec.is_competitor]
+    tallies: tuple[Dict[Any, RecordTally], RecordTally] | None = None,
+) -> Iterator[Dict[str, Any]]:
+    competitor_count = sum(1 for spec in specs if spec.is_competitor)
+    tallies_by_query, overall_tally = tallies or tally_records(
+        records, [spec.key for spec in specs]
+    )
 
-    def summarize(query_name: str, subset: Sequence[Dict[str, Any]], runs: int) -> Dict[str, Any]:
+    def summarize(query_name: str, tally: RecordTally, runs: int) -> Dict[str, Any]:
         row: Dict[str, Any] = {
             "query": query_name,
             "runs": runs,
             "web_search_enabled": "yes" if web_search_enabled else "no",
         }
-        citation_count = sum(len(item.get("citations", [])) for item in subset)
-        row["citation_count"] = citation_count
+        row["citation_count"] = tally.citation_count
 
         viability_count = 0
-        for spec in specs:
-            count = sum(
-                1
-                for item in subset
-                if bool(item.get("mentions", {}).get(spec.key, False))
-            )
+        counts = mask_counts_to_entity_counts(tally.mask_counts, len(specs))
+        for spec, count in zip(specs, counts):
             row[f"{spec.key}_yes"] = "yes" if count > 0 else "no"
             row[f"{spec.key}_count"] = count
             row[f"{spec.key}_rate"] = round((count / runs), 4) if runs else 0.0
-            if spec.key in competitor_keys:
+            if spec.is_competitor:
                 viability_count += count
 
         row["viability_index_count"] = viability_count
-        viability_denom = runs * len(competitor_keys)
+        viability_denom = runs * competitor_count
         row["viability_index_rate"] = (
             round((viability_count / viability_denom), 4) if viability_denom else 0.0
         )
         return row
 
     for query in queries:
-        query_records = [record for record in records if record.get("query") == query]
-        rows.append(summarize(query, query_records, runs_per_query))
+        tally = tallies_by_query.get(query) or RecordTally()
+        yield summarize(query, tally, runs_per_query)
 
     overall_runs = runs_per_query * len(queries)
-    rows.append(summarize("OVERALL", records, overall_runs))
-    return rows
+    yield summarize("OVERALL", overall_tally, overall_runs)
 
 
-def build_viability_rows(
+def build_comparison_rows(
     records: Sequence[Dict[str, Any]],
     specs: Sequence[EntitySpec],
     queries: Sequence[str],
     runs_per_query: int,
+    web_search_enabled: bool,
+    tallies: tuple[Dict[Any, RecordTally], RecordTally] | None = None,
 ) -> List[Dict[str, Any]]:
-    rows: List[Dict[str, Any]] = []
-
-    def summarize(query_name: str, subset: Sequence[Dict[str, Any]], runs: int) -> None:
-        for spec in specs:
-            count = sum(
-                1
-                for item in subset
-                if bool(item.get("mentions", {}).get(spec.key, False))
-            )
+    return list(
+        iter_comparison_rows(
+            records, specs, queries, runs_per_query, web_search_enabled, tallies
+        )
+    )
+
+
+def iter_viability_rows(
+    records: Sequence[Dict[str, Any]],
+    specs: Sequence[EntitySpec],
+    queries: Sequence[str],
+    runs_per_query: int,
+    tallies: tuple[Dict[Any, RecordTally], RecordTally] | None = None,
+) -> Iterator[Dict[str, Any]]:
+    tallies_by_query, overall_tally = tallies or tally_records(
+        records, [spec.key for spec in specs]
+    )
+
+    def summarize(
+        query_name: str, tally: RecordTally, runs: int
+    ) -> Iterator[Dict[str, Any]]:
+        counts = mask_counts_to_entity_counts(tally.mask_counts, len(specs))
+        for spec, count in zip(specs, counts):
             rate = round((count / runs), 4) if runs else 0.0
-            rows.append(
-                {
-                    "query": query_name,
-                    "entity": spec.label if spec.key != "our_brand" else "our_brand",
-                    "mentions_count": count,
-                    "mentions_rate": rate,
-                    "mentioned_yes": "yes" if count > 0 else "no",
-                }
-            )
+            yield {
+                "query": query_name,
+                "entity": spec.label if spec.key != "our_brand" else "our_brand",
+                "mentions_count": count,
+                "mentions_rate": rate,
+                "mentioned_yes": "yes" if count > 0 else "no",
+            }
 
     for query in queries:
-        query_records = [record for record in records if record.get("query") == query]
-        summarize(query, query_records, runs_per_query)
+        yield from summarize(
+            query, tallies_by_query.get(query) or RecordTally(), runs_per_query
+        )
 
     overall_runs = runs_per_query * len(queries)
-    summarize("OVERALL", records, overall_runs)
-    return rows
+    yield from summarize("OVERALL", overall_tally, overall_runs)
+
+
+def build_viability_rows(
+    records: Sequence[Dict[str, Any]],
+    specs: Sequence[EntitySpec],
+    queries: Sequence[str],
+    runs_per_query: int,
+    tallies: tuple[Dict[Any, RecordTally], RecordTally] | None = None,
+) -> List[Dict[str, Any]]:
+    return list(iter_viability_rows(records, specs, queries, runs_per_query, tallies))
+
 
+def write_csv(path: Path, rows: Iterable[Dict[str, Any]], fieldnames: Sequence[str]) -> None:
+    """Write rows under a fieldnames header with csv.writer.
 
-def write_csv(path: Path, rows: Sequence[Dict[str, Any]], fieldnames: Sequence[str]) -> None:
-    with path.open("w", newline="", encoding="utf-8") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(row)
+    Fields missing from a row are written as "". A row with a key outside
+    fieldnames raises ValueError, as csv.DictWriter does by default. Every
+    row is checked; rows go to a temporary sibling that replaces path only
+    once all of them are written, so on error an existing file is untouched.
+    """
+    header = frozenset(fieldnames)
+    temp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        with temp_path.open("w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(fieldnames)
+            for row in rows:
+                if not header.issuperset(row):
+                    raise ValueError(
+                        "dict contains fields not in fieldnames: "
+                        + ", ".join(repr(key) for key in row if key not in header)
+                    )
+                writer.writerow([row.get(field, "") for field in fieldnames])
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def summarize_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "query": record.get("query"),
+        "provider": record.get("provider"),
+        "mentions": record.get("mentions", {}),
+        "citation_count": len(record.get("citations", [])),
+        "error": record.get("error"),
+    }
 
 
 def run_benchmark(args: argparse.Namespace, client: Any | None = None) -> int:
@@ -1181,6 +1750,31 @@ def run_benchmark(args: argparse.Namespace, client: Any | None = None) -> int:
     if args.prompt_limit < 0:
         print("--prompt-limit must be >= 0", file=sys.stderr)
         return 2
+    if args.concurrency < 1:
+        print("--concurrency must be >= 1", file=sys.stderr)
+        return 2
+    if args.cache_ttl < 0:
+        print("--cache-ttl must be >= 0", file=sys.stderr)
+        return 2
+
+    our_terms = parse_csv_terms(args.our_terms)
+    if not our_terms:
+        print("--our-terms must include at least one non-empty term", file=sys.stderr)
+        return 2
+
+    try:
+        queries, competitors, alias_map, config_source = load_benchmark_config(
+            args.config
+        )
+    except Exception as exc:  # noqa: BLE001
+        print(f"Config error: {exc}", file=sys.stderr)
+        return 2
+    total_config_queries = len(queries)
+    if args.prompt_limit > 0:
+        queries = queries[: args.prompt_limit]
+        print(
+            f"Prompt limit enabled: running {len(queries)}/{total_config_queries} prompts."
+        )
 
     selected_models = parse_model_names(str(args.model or ""))
     providers_by_model = {
@@ -1196,8 +1790,9 @@ def run_benchmark(args: argparse.Namespace, client: Any | None = None) -> int:
         )
         return 2
 
-    provider_clients: Dict[str, Any] = {}
-    provider_model_owner: Dict[str, str] = {}
+    # Check every provider's key before constructing any SDK client, so a
+    # missing key for the last provider does not wait on the first one's setup.
+    api_keys: Dict[str, str] = {}
     for provider in providers:
         api_key_env = resolve_api_key_env(provider, args.api_key_env)
         api_key = normalize_api_key(os.getenv(api_key_env))
@@ -1208,31 +1803,16 @@ def run_benchmark(args: argparse.Namespace, client: Any | None = None) -> int:
                 file=sys.stderr,
             )
             return 2
+        api_keys[provider] = api_key
 
+    provider_clients: Dict[str, Any] = {}
+    provider_model_owner: Dict[str, str] = {}
+    for provider, api_key in api_keys.items():
         provider_clients[provider] = (
             client if client is not None else create_llm_client(provider, api_key)
         )
         provider_model_owner[provider] = infer_model_owner(provider)
 
-    our_terms = parse_csv_terms(args.our_terms)
-    if not our_terms:
-        print("--our-terms must include at least one non-empty term", file=sys.stderr)
-        return 2
-
-    try:
-        queries, competitors, alias_map, config_source = load_benchmark_config(
-            args.config
-        )
-    except Exception as exc:  # noqa: BLE001
-        print(f"Config error: {exc}", file=sys.stderr)
-        return 2
-    total_config_queries = len(queries)
-    if args.prompt_limit > 0:
-        queries = queries[: args.prompt_limit]
-        print(
-            f"Prompt limit enabled: running {len(queries)}/{total_config_queries} prompts."
-        )
-
     specs = build_entity_specs(
         our_terms=our_terms,
         competitors=competitors,
@@ -1245,7 +1825,6 @@ def run_benchmark(args: argparse.Namespace, client: Any | None = None) -> int:
     jsonl_path = output_dir / "llm_outputs.jsonl"
     comparison_path = output_dir / "comparison_table.csv"
     viability_path = output_dir / "viability_index.csv"
-    reset_jsonl(jsonl_path)
 
     if args.web_search:
         non_openai_models = [
@@ -1266,72 +1845,188 @@ def run_benchmark(args: argparse.Namespace, client: Any | None = None) -> int:
         print("No model runs resolved. Provide at least one model.", file=sys.stderr)
         return 2
 
-    records: List[Dict[str, Any]] = []
-    successful_calls = 0
     total_calls = len(queries) * effective_runs_per_query
+    response_cache = (
+        ResponseCache(Path(args.cache_path).expanduser(), args.cache_ttl)
+        if args.cache_path
+        else None
+    )
 
-    for query in queries:
-        for model_index, model_name in enumerate(selected_models):
-            provider = providers_by_model[model_name]
-            llm_client = provider_clients[provider]
-            model_owner = provider_model_owner[provider]
-            effective_web_search = args.web_search if provider == "openai" else False
-
-            for model_run_idx in range(1, args.runs + 1):
-                run_iteration = (model_index * args.runs) + model_run_idx
-                timestamp = datetime.now(timezone.utc).isoformat()
-                response_text = ""
-                citations: List[Dict[str, Any]] = []
-                token_usage = {
-                    "prompt_tokens": 0,
-                    "completion_tokens": 0,
-                    "total_tokens": 0,
-                }
-                error = None
-                started_at = time.perf_counter()
-                try:
-                    response_text, citations, token_usage = generate_with_optional_retry(
-                        client=llm_client,
-                        provider=provider,
-                        model=model_name,
-                        query=query,
-                        temperature=DEFAULT_TEMPERATURE,
-                        web_search=effective_web_search,
+    # Everything run_call needs per model, resolved once instead of per call.
+    runs_per_model = args.runs
+    model_call_settings = {
+        model_name: (
+            provider,
+            provider_clients[provider],
+            provider_model_owner[provider],
+            args.web_search if provider == "openai" else False,
+        )
+        for model_name, provider in providers_by_model.items()
+    }
+
+    def run_call(
+        query: str, model_index: int, model_name: str, model_run_idx: int
+    ) -> Dict[str, Any]:
+        provider, llm_client, model_owner, effective_web_search = (
+            model_call_settings[model_name]
+        )
+        timestamp = datetime.now(timezone.utc).isoformat()
+        response_text = ""
+        citations: List[Dict[str, Any]] = []
+        token_usage = {
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "total_tokens": 0,
+        }
+        error = None
+        cache_key = ""
+        cached = None
+        if response_cache is not None:
+            cache_key = response_cache.make_key(
+                provider=provider,
+                model=model_name,
+                query=query,
+                temperature=DEFAULT_TEMPERATURE,
+                web_search=effective_web_search,
+                run_slot=model_run_idx,
+            )
+            cached = response_cache.get(cache_key)
+        if cached is not None:
+            # Replay the original call's timing as well as its answer.
+            response_text, citations, token_usage, duration_ms, timestamp = cached
+        else:
+            started_ns = time.perf_counter_ns()
+            try:
+                response_text, citations, token_usage = generate_with_optional_retry(
+                    client=llm_client,
+                    provider=provider,
+                    model=model_name,
+                    query=query,
+                    temperature=DEFAULT_TEMPERATURE,
+                    web_search=effective_web_search,
+                )
+            except Exception as exc:  # noqa: BLE001
+                error = f"{exc.__class__.__name__}: {exc}"
+            # Integer nanoseconds, rounded to the nearest millisecond.
+            duration_ms = (time.perf_counter_ns() - started_ns + 500_000) // 1_000_000
+            if error is None and response_cache is not None:
+                response_cache.put(
+                    cache_key,
+                    response_text,
+                    citations,
+                    token_usage,
+                    duration_ms,
+                    timestamp,
+                )
+
+        mentions = detect_mentions(response_text, compiled_patterns)
+        return {
+            "timestamp": timestamp,
+            "model": model_name,
+            "provider": provider,
+            "model_owner": model_owner,
+            "query": query,
+            "run_id": (model_index * runs_per_model) + model_run_idx,
+            "model_run_id": model_run_idx,
+            "model_index": model_index + 1,
+            "web_search_enabled": effective_web_search,
+            "duration_ms": duration_ms,
+            "prompt_tokens": token_usage["prompt_tokens"],
+            "completion_tokens": token_usage["completion_tokens"],
+            "total_tokens": token_usage["total_tokens"],
+            "response_text": response_text,
+            "citations": citations,
+            "error": error,
+            "mentions": mentions,
+            "cache_hit": cached is not None,
+        }
+
+    call_plan = [
+        (query, model_index, model_name, model_run_idx)
+        for query in queries
+        for model_index, model_name in enumerate(selected_models)
+        for model_run_idx in range(1, args.runs + 1)
+    ]
+
+    def iter_call_records() -> Iterable[Dict[str, Any]]:
+        if args.concurrency <= 1:
+            for call in call_plan:
+                yield run_call(*call)
+            return
+        # The calls are network-bound, so threads overlap their latency. Rate
+        # limits are per provider, so each provider gets its own pool and a slow
+        # or throttled provider cannot hold the others' slots. Results are still
+        # consumed in plan order to keep the JSONL deterministic.
+        with ExitStack() as stack:
+            executors = {
+                provider: stack.enter_context(
+                    ThreadPoolExecutor(
+                        max_workers=args.concurrency,
+                        thread_name_prefix=f"benchmark-{provider}",
                     )
-                    successful_calls += 1
-                except Exception as exc:  # noqa: BLE001
-                    error = f"{exc.__class__.__name__}: {exc}"
-
-                duration_ms = int(round((time.perf_counter() - started_at) * 1000))
-                mentions = detect_mentions(response_text, compiled_patterns)
-                record = {
-                    "timestamp": timestamp,
-                    "model": model_name,
-                    "provider": provider,
-                    "model_owner": model_owner,
-                    "query": query,
-                    "run_id": run_iteration,
-                    "model_run_id": model_run_idx,
-                    "model_index": model_index + 1,
-                    "web_search_enabled": effective_web_search,
-                    "duration_ms": duration_ms,
-                    "prompt_tokens": token_usage["prompt_tokens"],
-                    "completion_tokens": token_usage["completion_tokens"],
-                    "total_tokens": token_usage["total_tokens"],
-                    "response_text": response_text,
-                    "citations": citations,
-                    "error": error,
-                    "mentions": mentions,
-                }
-                append_jsonl(jsonl_path, record)
-                records.append(record)
+                )
+                for provider in providers
+            }
+            futures = [
+                executors[providers_by_model[call[2]]].submit(run_call, *call)
+                for call in call_plan
+            ]
+            try:
+                for future in futures:
+                    yield future.result()
+            except BaseException:
+                # A failed write, Ctrl-C or an abandoned generator must not
+                # leave the pools' exit to run every queued (paid) call.
+                for executor in executors.values():
+                    executor.shutdown(wait=False, cancel_futures=True)
+                raise
 
-    comparison_rows = build_comparison_rows(
+    records: List[Dict[str, Any]] = []
+    successful_calls = 0
+    error_counts: Counter[str] = Counter()
+    error_providers: set[str] = set()
+    with ExitStack() as stack:
+        if response_cache is not None:
+            stack.callback(response_cache.close)
+        if client is None:
+            # Clients created for this run (e.g. the Gemini client's per-thread
+            # keep-alive sockets) are closed once its calls are done.
+            for provider_client in provider_clients.values():
+                close_client = getattr(provider_client, "close", None)
+                if callable(close_client):
+                    stack.callback(close_client)
+        jsonl_handle = stack.enter_context(open_jsonl(jsonl_path))
+        last_flush = time.monotonic()
+        call_records = stack.enter_context(closing(iter_call_records()))
+        for record in call_records:
+            write_jsonl_record(jsonl_handle, record)
+            # Flush at most every JSONL_FLUSH_INTERVAL_SECONDS so a killed run
+            # still leaves nearly every finished response on disk, while
+            # cache replays and fast failures share one write per interval.
+            now = time.monotonic()
+            if now - last_flush >= JSONL_FLUSH_INTERVAL_SECONDS:
+                jsonl_handle.flush()
+                last_flush = now
+            # The full record now lives in the JSONL file; keep only what the
+            # CSV aggregation and error summary read, not the response text.
+            records.append(summarize_record(record))
+            error = record["error"]
+            if error is None:
+                successful_calls += 1
+            else:
+                error_counts[str(error).strip()] += 1
+                error_providers.add(str(record["provider"] or "").strip().lower())
+
+    # Both tables aggregate the same per-query tallies; compute them once, then
+    # stream the rows straight into the CSV writers rather than collecting them.
+    tallies = tally_records(records, [spec.key for spec in specs])
+    comparison_rows = iter_comparison_rows(
         records=records,
         specs=specs,
         queries=queries,
         runs_per_query=effective_runs_per_query,
         web_search_enabled=args.web_search,
+        tallies=tallies,
     )
     comparison_fields = ["query", "runs", "web_search_enabled"]
     for spec in specs:
@@ -1343,11 +2038,12 @@ def run_benchmark(args: argparse.Namespace, client: Any | None = None) -> int:
     )
     write_csv(comparison_path, comparison_rows, comparison_fields)
 
-    viability_rows = build_viability_rows(
+    viability_rows = iter_viability_rows(
         records=records,
         specs=specs,
         queries=queries,
         runs_per_query=effective_runs_per_query,
+        tallies=tallies,
     )
     write_csv(
         viability_path,
@@ -1367,30 +2063,18 @@ def run_benchmark(args: argparse.Namespace, client: Any | None = None) -> int:
     print(f"Successful calls: {successful_calls}/{total_calls}")
     if failed_calls:
         print(f"Failed calls: {failed_calls}/{total_calls}", file=sys.stderr)
-        error_messages = [
-            str(record.get("error") or "").strip()
-            for record in records
-            if record.get("error")
-        ]
-        if error_messages:
+        if error_counts:
             print("Top API errors:", file=sys.stderr)
-            for message, count in Counter(error_messages).most_common(3):
+            for message, count in error_counts.most_common(3):
                 print(f"- {count}x {message}", file=sys.stderr)
             all_connection_errors = all(
                 "connection error" in message.lower()
                 or "apiconnectionerror" in message.lower()
-                for message in error_messages
+                for message in error_counts
             )
             if all_connection_errors:
-                error_providers = sorted(
-                    {
-                        str(record.get("provider") or "").strip().lower()
-                        for record in records
-                        if record.get("error")
-                    }
-                )
                 if len(error_providers) == 1:
-                    provider = error_providers[0]
+                    (provider,) = error_providers
                     if provider == "anthropic":
                         print(
                             "Hint: all calls failed with connection errors. "
@@ -3,6 +3,7 @@
 from .legacy import (
     GeminiRestClient,
     ProviderRequestError,
+    ResponseCache,
     create_anthropic_client,
     create_gemini_client,
     create_llm_client,
@@ -18,6 +19,7 @@ from .legacy import (
 __all__ = [
     "GeminiRestClient",
     "ProviderRequestError",
+    "ResponseCache",
     "create_anthropic_client",
     "create_gemini_client",
     "create_llm_client",
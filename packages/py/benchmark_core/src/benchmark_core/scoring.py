@@ -1,5 +1,19 @@
 """Benchmark scoring helpers."""
 
-from .legacy import build_comparison_rows, build_viability_rows
+from .legacy import (
+    RecordTally,
+    build_comparison_rows,
+    build_viability_rows,
+    iter_comparison_rows,
+    iter_viability_rows,
+    tally_records,
+)
 
-__all__ = ["build_comparison_rows", "build_viability_rows"]
+__all__ = [
+    "RecordTally",
+    "build_comparison_rows",
+    "build_viability_rows",
+    "iter_comparison_rows",
+    "iter_viability_rows",
+    "tally_records",
+]
@@ -1,5 +1,7 @@
 import importlib.util
+import json
 import sys
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -37,6 +39,17 @@ class DynamicEntityTests(unittest.TestCase):
             places=2,
         )
 
+    def test_h2h_winner_follows_count_comparison(self):
+        winners = [
+            builder.h2h_values(hc, 0.5, "d3_js", entity, 0.5)["h2h_winner"]
+            for hc, entity in ((3, 1), (1, 1), (0, 2))
+        ]
+        self.assertEqual(winners, ["highcharts", "tie", "competitor"])
+        self.assertEqual(
+            builder.h2h_values(0, 0.0, "highcharts", 5, 0.0)["h2h_winner"],
+            "highcharts",
+        )
+
     def test_infer_entity_keys_excludes_our_brand_and_special_counts(self):
         rows = [
             {
@@ -205,6 +218,81 @@ class DynamicEntityTests(unittest.TestCase):
         self.assertAlmostEqual(float(d3_q1["share_of_voice_rate"]), 0.666667, places=6)
         self.assertAlmostEqual(float(d3_q1["share_of_voice_rate_pct"]), 66.67, places=2)
 
+    def test_write_csv_blanks_missing_fields_and_rejects_extra_ones(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "out.csv"
+            builder.write_csv(path, [{"a": 1}, {"a": 2, "b": "x"}], ["a", "b"])
+            self.assertEqual(path.read_text(encoding="utf-8"), "a,b\n1,\n2,x\n")
+
+            for rows in ([{"a": 1, "c": 3}], [{"a": 1}, {"a": 2, "c": 3}]):
+                with self.assertRaises(ValueError):
+                    builder.write_csv(path, iter(rows), ["a", "b"])
+                self.assertEqual(
+                    path.read_text(encoding="utf-8"), "a,b\n1,\n2,x\n"
+                )
+            self.assertEqual([p.name for p in Path(temp_dir).iterdir()], ["out.csv"])
+
+
+class JsonlContextTests(unittest.TestCase):
+    def test_extract_context_consumes_streamed_rows(self):
+        records = [
+            {
+                "timestamp": "2026-02-16T10:01:00+00:00",
+                "model": "gpt-4o-mini",
+                "prompt_tokens": 3,
+                "completion_tokens": 4,
+                "duration_ms": 10,
+            },
+            {
+                "timestamp": "2026-02-16T10:00:00+00:00",
+                "model": "claude-sonnet-4-5",
+                "model_owner": "Anthropic",
+                "total_tokens": 20,
+                "duration_ms": 30,
+                "error": "RuntimeError: boom",
+            },
+            {"timestamp": "2026-02-16T10:02:00+00:00", "model": ""},
+        ]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "llm_outputs.jsonl"
+            lines = [json.dumps(record) for record in records]
+            path.write_text("\n".join(lines[:2] + ["{not json", ""] + lines[2:]))
+            rows = builder.iter_jsonl_rows(path)
+            self.assertNotIsInstance(rows, list)
+            context = builder.extract_context(rows)
+
+        self.assertEqual(context["window_start_utc"], "2026-02-16T10:00:00+00:00")
+        self.assertEqual(context["window_end_utc"], "2026-02-16T10:02:00+00:00")
+        self.assertEqual(context["models"], "claude-sonnet-4-5;gpt-4o-mini")
+        self.assertEqual(context["model_owners"], "Anthropic;OpenAI")
+        self.assertEqual(
+            context["model_owner_map"],
+            ";".join(
+                f"{model}=>{owner}"
+                for model, owner in sorted(
+                    builder.build_model_owner_mapping(records).items()
+                )
+            ),
+        )
+        self.assertEqual(context["total_tokens"], "27")
+        self.assertEqual(context["total_duration_ms"], "40")
+        stats = {row["model"]: row for row in json.loads(context["model_stats_json"])}
+        self.assertEqual(stats["claude-sonnet-4-5"]["error_count"], 1)
+        self.assertEqual(stats["gpt-4o-mini"]["total_tokens"], 7)
+        self.assertEqual(builder.read_jsonl_rows(Path(temp_dir) / "missing.jsonl"), [])
+
+    def test_jsonl_lines_are_parsed_from_bytes(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "llm_outputs.jsonl"
+            path.write_bytes(
+                b'{"query": "gr\xc3\xa1ficos"}\r\n\xff\xfe\n{"duration_ms": NaN}\n'
+            )
+            rows = builder.read_jsonl_rows(path)
+
+        self.assertEqual(rows[0], {"query": "gráficos"})
+        self.assertEqual(len(rows), 2)
+        self.assertNotEqual(rows[1]["duration_ms"], rows[1]["duration_ms"])
+
 
 if __name__ == "__main__":
     unittest.main()
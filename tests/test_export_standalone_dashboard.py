@@ -0,0 +1,309 @@
+import csv
+import importlib.util
+import json
+import os
+import re
+import stat
+import sys
+import tempfile
+import unittest
+from concurrent.futures import Future
+from pathlib import Path
+from unittest import mock
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+TEMPLATE_PATH = Path(__file__).resolve().parents[1] / "dashboard" / "dashboard.html"
+
+
+def _load_exporter_module():
+    module_path = (
+        Path(__file__).resolve().parents[1]
+        / "dashboard"
+        / "export_standalone_dashboard.py"
+    )
+    spec = importlib.util.spec_from_file_location(
+        "export_standalone_dashboard", module_path
+    )
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Unable to import module from {module_path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+exporter = _load_exporter_module()
+
+
+def _embedded_payload(html: str):
+    match = re.search(
+        r"window\.__EMBEDDED_BENCHMARK_DATA__ = (.*?);\n  </script>", html, re.S
+    )
+    if match is None:
+        raise AssertionError("Embedded payload not found in exported HTML.")
+    return json.loads(match.group(1))
+
+
+class ReadCsvRowsTests(unittest.TestCase):
+    def test_matches_dict_reader_output(self):
+        path = FIXTURES_DIR / "comparison_table.csv"
+        with path.open("r", encoding="utf-8", newline="") as handle:
+            expected = list(csv.DictReader(handle))
+        self.assertEqual(exporter.read_csv_rows(path), expected)
+
+    def test_short_rows_are_padded_like_dict_reader(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "ragged.csv"
+            path.write_text(
+                "query,runs,highcharts_count\nq1,2\n\nq2,3,1\n", encoding="utf-8"
+            )
+            with path.open("r", encoding="utf-8", newline="") as handle:
+                expected = list(csv.DictReader(handle))
+            self.assertEqual(exporter.read_csv_rows(path), expected)
+            self.assertIsNone(expected[0]["highcharts_count"])
+
+    def test_empty_file_returns_no_rows(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "empty.csv"
+            path.write_text("", encoding="utf-8")
+            self.assertEqual(exporter.read_csv_rows(path), [])
+
+
+class NormalizeWebSearchFlagTests(unittest.TestCase):
+    def test_normalizes_bool_and_string_spellings(self):
+        cases = {
+            True: "yes",
+            False: "no",
+            None: "",
+            "1": "yes",
+            " TRUE ": "yes",
+            "No": "no",
+            "0": "no",
+            "maybe": "maybe",
+        }
+        for value, expected in cases.items():
+            self.assertEqual(exporter.normalize_web_search_flag(value), expected)
+        self.assertEqual(exporter.normalize_web_search_flag([]), "")
+
+
+class ReadJsonlRowsTests(unittest.TestCase):
+    def test_keeps_summary_fields_and_skips_invalid_lines(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "llm_outputs.jsonl"
+            path.write_text(
+                "\n".join(
+                    [
+                        json.dumps(
+                            {
+                                "timestamp": "2026-02-01T00:00:00+00:00",
+                                "model": "gpt-4o-mini",
+                                "query": "q1",
+                                "run_id": 1,
+                                "web_search_enabled": True,
+                                "citations": [{"url": "https://a"}, {"url": "https://b"}],
+                                "error": None,
+                                "response_text": "dropped",
+                            }
+                        ),
+                        "",
+                        "{not json",
+                        "[1, 2, 3]",
+                        json.dumps({"query": "q2", "web_search_enabled": " FALSE "}),
+                    ]
+                )
+                + "\n",
+                encoding="utf-8",
+            )
+            rows = exporter.read_jsonl_rows(path)
+
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(
+            rows[0],
+            {
+                "timestamp": "2026-02-01T00:00:00+00:00",
+                "model": "gpt-4o-mini",
+                "query": "q1",
+                "run_id": 1,
+                "web_search_enabled": "yes",
+                "citation_count": 2,
+                "error": None,
+            },
+        )
+        self.assertEqual(rows[1]["web_search_enabled"], "no")
+        self.assertEqual(rows[1]["citation_count"], 0)
+
+    def test_lines_outside_orjson_range_fall_back_to_stdlib(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "llm_outputs.jsonl"
+            path.write_bytes(
+                b'{"query": "q1", "run_id": 18446744073709551616, "score": NaN}\n'
+                b'{"query": "\xff"}\n'
+                b'{"query": "q2", "run_id": 2}\n'
+            )
+            rows = exporter.read_jsonl_rows(path)
+
+        self.assertEqual([row["query"] for row in rows], ["q1", "q2"])
+        self.assertEqual(rows[0]["run_id"], 2**64)
+        self.assertEqual(json.loads(exporter._dumps(rows[0]))["run_id"], 2**64)
+
+    def test_lines_split_across_read_chunks(self):
+        expected = exporter.read_jsonl_rows(FIXTURES_DIR / "llm_outputs.jsonl")
+        with mock.patch.object(exporter, "JSONL_READ_CHUNK_BYTES", 7):
+            rows = exporter.read_jsonl_rows(FIXTURES_DIR / "llm_outputs.jsonl")
+        self.assertEqual(rows, expected)
+        self.assertTrue(rows)
+
+    def test_parallel_ranges_match_serial_parse(self):
+        path = FIXTURES_DIR / "llm_outputs.jsonl"
+        expected = exporter.read_jsonl_rows(path)
+
+        ranges = exporter._jsonl_byte_ranges(path, 4)
+        self.assertEqual(ranges[0][0], 0)
+        self.assertEqual(ranges[-1][1], path.stat().st_size)
+        chunked = [
+            row
+            for start, end in ranges
+            for row in exporter._parse_jsonl_range(str(path), start, end)
+        ]
+        self.assertEqual(chunked, expected)
+
+        with mock.patch.object(exporter, "_jsonl_worker_count", return_value=3):
+            self.assertEqual(exporter.read_jsonl_rows(path), expected)
+
+
+    def test_parallel_parse_bounds_ranges_in_flight_and_cancels_on_close(self):
+        path = FIXTURES_DIR / "llm_outputs.jsonl"
+        expected = exporter.read_jsonl_rows(path)
+        executors = []
+
+        class InlineExecutor:
+            def __init__(self, max_workers):
+                self.submitted = 0
+                self.shutdown_kwargs = None
+                executors.append(self)
+
+            def submit(self, fn, *args):
+                self.submitted += 1
+                future = Future()
+                future.set_result(fn(*args))
+                return future
+
+            def shutdown(self, **kwargs):
+                self.shutdown_kwargs = kwargs
+
+        with (
+            mock.patch.object(exporter, "ProcessPoolExecutor", InlineExecutor),
+            mock.patch.object(exporter, "_jsonl_worker_count", return_value=2),
+            mock.patch.object(exporter, "JSONL_PARALLEL_RANGE_BYTES", 1024),
+        ):
+            self.assertEqual(exporter.read_jsonl_rows(path), expected)
+            self.assertGreater(executors[0].submitted, 2)
+
+            rows = exporter.iter_jsonl_rows(path)
+            self.assertEqual(next(rows), expected[0])
+            self.assertEqual(executors[1].submitted, 3)
+            rows.close()
+
+        self.assertEqual(executors[1].shutdown_kwargs, {"cancel_futures": True})
+
+
+class EmbedDataTests(unittest.TestCase):
+    TEMPLATE = "<html>\n  <script>\n    const ENTITY_LABELS = {};\n  </script>\n"
+
+    def _export(self, template, payload):
+        payload_json = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            template_path = Path(temp_dir) / "dashboard.html"
+            template_path.write_text(template, encoding="utf-8")
+            export_path = Path(temp_dir) / "dashboard_standalone.html"
+            exporter.write_standalone_html(export_path, template_path, payload_json)
+            return export_path.read_text(encoding="utf-8")
+
+    def test_embeds_payload_and_escapes_script_close(self):
+        payload = {"comparisonRows": [{"query": "</script><b>"}, {"query": "a</"}]}
+
+        html = self._export(self.TEMPLATE, payload)
+
+        self.assertTrue(html.startswith("<html>\n" + exporter.EMBED_PREFIX))
+        self.assertNotIn("</script><b>", html)
+        self.assertEqual(html.count("<\\/"), 2)
+        self.assertEqual(_embedded_payload(html), payload)
+        self.assertTrue(html.endswith("    const ENTITY_LABELS = {};\n  </script>\n"))
+
+        embedded = exporter.embed_data(self.TEMPLATE, payload)
+        self.assertEqual(_embedded_payload(embedded), payload)
+        self.assertEqual(embedded.count("<\\/"), 2)
+
+    def test_keeps_non_ascii_text_unescaped(self):
+        payload = {"jsonlRows": [{"query": "gráficos de datos"}]}
+
+        html = self._export(self.TEMPLATE, payload)
+
+        self.assertIn("gráficos de datos", html)
+        self.assertEqual(_embedded_payload(html), payload)
+
+    def test_rejects_template_without_marker(self):
+        for template in ("<html></html>", ""):
+            with self.assertRaises(ValueError):
+                self._export(template, {})
+            with self.assertRaises(ValueError):
+                exporter.embed_data(template, {})
+
+    def test_builds_payload_from_fixture_outputs(self):
+        payload_json = exporter.build_payload_json(FIXTURES_DIR)
+        expected = {
+            "comparisonRows": exporter.read_csv_rows(
+                FIXTURES_DIR / "comparison_table.csv"
+            ),
+            "viabilityRows": exporter.read_csv_rows(
+                FIXTURES_DIR / "viability_index.csv"
+            ),
+            "jsonlRows": exporter.read_jsonl_rows(FIXTURES_DIR / "llm_outputs.jsonl"),
+        }
+        self.assertEqual(json.loads(payload_json), expected)
+        self.assertEqual(exporter.build_payload(FIXTURES_DIR), expected)
+
+        html = self._export(TEMPLATE_PATH.read_text(encoding="utf-8"), expected)
+        embedded = _embedded_payload(html)
+        self.assertEqual(embedded, expected)
+        self.assertEqual(embedded["comparisonRows"][-1]["query"], "OVERALL")
+        self.assertTrue(embedded["jsonlRows"])
+
+    def test_template_edits_between_exports_are_picked_up(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            template_path = Path(temp_dir) / "dashboard.html"
+            export_path = Path(temp_dir) / "dashboard_standalone.html"
+            for prefix in ("", "<main>"):
+                template_path.write_text(prefix + self.TEMPLATE, encoding="utf-8")
+                exporter.write_standalone_html(export_path, template_path, b"{}")
+                html = export_path.read_text(encoding="utf-8")
+                self.assertTrue(
+                    html.startswith(prefix + "<html>\n" + exporter.EMBED_PREFIX)
+                )
+
+    def test_write_export_replaces_existing_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "dashboard_standalone.html"
+            path.write_bytes(b"stale content that is longer than the export")
+            exporter.write_export(path, [b"<html>", "é</html>".encode("utf-8")])
+            self.assertEqual(path.read_text(encoding="utf-8"), "<html>é</html>")
+
+    @unittest.skipIf(os.name != "posix", "umask only applies on POSIX")
+    def test_write_export_applies_the_umask_to_new_files(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "dashboard_standalone.html"
+            previous = os.umask(0o002)
+            try:
+                exporter.write_export(path, [b"<html></html>"])
+            finally:
+                os.umask(previous)
+            self.assertEqual(stat.S_IMODE(path.stat().st_mode), 0o664)
+
+    def test_missing_outputs_are_reported(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with self.assertRaises(FileNotFoundError):
+                exporter.build_payload_json(Path(temp_dir))
+
+
+if __name__ == "__main__":
+    unittest.main()